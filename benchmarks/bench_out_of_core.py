@@ -0,0 +1,59 @@
+# Peak memory of the streaming pipeline (stream_experiment) on a synthetic
+# DWStemp log far bigger than the blocks it reads. Peak RSS should stay flat
+# whatever --gigabytes is.
+#
+#   python benchmarks/bench_out_of_core.py --gigabytes 10
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import src
+import synthetic
+
+def stream(path, queue):
+    start = time.perf_counter()
+    experiment, stats = src.stream_experiment(path, 1, 1)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    queue.put((elapsed, peak, len(experiment), stats['pressure'].count, stats['pressure'].mean, stats['pressure'].std))
+
+def main():
+    parser = argparse.ArgumentParser(description="Peak memory of the out-of-core pipeline")
+    parser.add_argument("--gigabytes", type=float, default=10)
+    parser.add_argument("--path", default=None, help="Reuse (or keep) the synthetic log at this path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.path or os.path.join(tmp, "synthetic.csv")
+        if not os.path.exists(path):
+            start = time.perf_counter()
+            rows = int(args.gigabytes * 2**30 // synthetic.LINE_BYTES)
+            synthetic.write_dwstemp(path, rows)
+            print(f"wrote {rows} rows in {time.perf_counter() - start:.0f} s")
+        print(f"log size     {os.path.getsize(path) / 2**30:8.2f} GiB")
+
+        # Fresh (spawned, not forked) process, so its peak RSS is the pipeline's alone
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        process = context.Process(target=stream, args=(path, queue))
+        process.start()
+        elapsed, peak_kib, kept, count, mean, std = queue.get()
+        process.join()
+
+        print(f"streamed     {count} rows in {elapsed:.1f} s ({os.path.getsize(path) / 2**20 / elapsed:.0f} MiB/s)")
+        print(f"kept         {kept} envelope rows for plotting")
+        print(f"pressure     mean {mean:.3f}, std {std:.3f}")
+        print(f"peak RSS     {peak_kib / 1024:8.1f} MiB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Compare the old read_csv -> iloc -> astype path with read_dwstemp on a
+# scaled-up copy of Assets/Example1.csv.
+#
+#   python benchmarks/bench_reader.py --scale 200
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import src
+
+EXAMPLE = os.path.join(ROOT, "Assets", "Example1.csv")
+
+def scale_example(path, scale):
+    # Repeat the example rows, keeping RecNo. and Time increasing
+    with open(EXAMPLE, encoding="cp949", newline="") as f:
+        header = [f.readline(), f.readline()]
+        rows = [line.rstrip("\r\n").split(",") for line in f if line.strip()]
+
+    step = float(rows[-1][1])
+    with open(path, "w", encoding="cp949", newline="") as f:
+        f.writelines(header)
+        rec = 0
+        for k in range(scale):
+            offset = k * step
+            lines = []
+            for row in rows:
+                rec += 1
+                lines.append(f"{rec:>10},{float(row[1]) + offset:>10.0f},{','.join(row[2:])}\r\n")
+            f.writelines(lines)
+    return rec
+
+def legacy_load(path):
+    df = pd.read_csv(path, encoding="cp949", header=1)
+    time_sec = df.iloc[1:, 1].astype(float)
+    pressure = df.iloc[1:, 2].astype(float)
+    temperature = df.iloc[1:, 4].astype(float)
+    return time_sec, pressure, temperature
+
+def measure(label, func, path, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(path)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<28} {best * 1000:>10.1f} ms   peak {peak / 2**20:>8.1f} MiB")
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the DWStemp CSV reader")
+    parser.add_argument("--scale", type=int, default=200, help="How many times to repeat Example1.csv")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scaled.csv")
+        rows = scale_example(path, args.scale)
+        print(f"{rows} rows, {os.path.getsize(path) / 2**20:.1f} MiB")
+
+        legacy = measure("read_csv + astype (old)", legacy_load, path, args.repeat)
+        engines = ["c", "pyarrow"] if src.CSV_ENGINE == "pyarrow" else ["c"]
+        for engine in engines:
+            new = measure(f"read_dwstemp ({engine})", lambda p: src.read_dwstemp(p, [src.TIME_COLUMN, 2, 4], engine=engine), path, args.repeat)
+            print(f"{'':<28} {legacy / new:>10.1f}x faster")
+
+if __name__ == "__main__":
+    main()
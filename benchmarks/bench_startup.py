@@ -0,0 +1,72 @@
+# Cold-start timings of the GUI: time from launching the interpreter until
+# the window is shown, and until the first plot of Assets/Example1.csv is
+# drawn. Runs each launch in a fresh process (offscreen Qt by default).
+#
+#   python benchmarks/bench_startup.py --runs 5
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import sys, time, json
+launched = float(sys.argv[1])
+sys.path.insert(0, sys.argv[2])
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
+import src
+
+app = QApplication(sys.argv[:1])
+gui = src.DWSPapyrusGUI()
+gui.show()
+times = {}
+
+def shown():
+    times['window'] = time.time() - launched
+    if hasattr(gui, "start_warm_up"):
+        gui.start_warm_up()
+    QTimer.singleShot(0, first_plot)
+
+def first_plot():
+    settings = gui.current_settings()
+    experiment, _ = src.load_experiment(sys.argv[3], 1, 1, settings['divide_pressure_by'], settings['divide_temp_by'])
+    data_x, data_y = experiment.select(settings['x_var'], settings['y_var'], settings['time_unit'])
+    gui.preview_dialog()
+    gui.plot_view.update(data_x, data_y, settings, experiment.version)
+    gui.plot_view.canvas.draw()
+    times['first_plot'] = time.time() - launched
+    print(json.dumps(times))
+    app.quit()
+
+QTimer.singleShot(0, shown)
+app.exec()
+"""
+
+def launch(csv_path):
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    # Cold parse every time: the parsed-log cache would hide the load cost
+    env["DWSPAPYRUS_NO_CACHE"] = "1"
+    output = subprocess.run([sys.executable, "-c", CHILD, repr(time.time()), ROOT, csv_path], env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Time-to-window and time-to-first-plot of the GUI")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--csv", default=os.path.join(ROOT, "Assets", "Example1.csv"))
+    args = parser.parse_args()
+
+    runs = [launch(args.csv) for _ in range(args.runs)]
+    for key, label in (("window", "time to window"), ("first_plot", "time to first plot")):
+        values = [run[key] * 1000 for run in runs]
+        print(f"{label:<20} median {statistics.median(values):8.0f} ms   min {min(values):8.0f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# Hot-path timings at several log sizes, written as a JSON report that a
+# later run can be compared against. Every size runs in a fresh process
+# (offscreen Qt) so its peak RSS belongs to that size alone.
+#
+#   python benchmarks/bench_suite.py --sizes 1e4,1e5,1e6 -o report.json
+#   python benchmarks/bench_suite.py --baseline report.json
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import synthetic
+
+STAGES = ["parse", "statistics", "series", "render", "save_png", "save_pdf"]
+
+# Stages faster than this are too noisy to call a regression
+NOISE_FLOOR_S = 0.02
+
+def peak_rss_mib():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    return peak / 1024
+
+def run_size(path, repeat, output_dir, queue):
+    # Child process: the GUI's own load -> stats -> select -> draw -> save path
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ["DWSPAPYRUS_NO_CACHE"] = "1"
+
+    from PyQt6.QtWidgets import QApplication
+    import src
+
+    app = QApplication([])
+    src.rcparams()
+    settings = dict(src.DEFAULT_SETTINGS, x_var="time", y_var="temperature", time_unit="hr")
+    columns = [src.TIME_COLUMN, src.pressure_column(1), src.temperature_column(1)]
+    streamed = os.path.getsize(path) > src.OUT_OF_CORE_BYTES
+
+    timings = {stage: float("inf") for stage in STAGES}
+    memory = {"start": peak_rss_mib()}
+
+    def timed(stage, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        timings[stage] = min(timings[stage], time.perf_counter() - start)
+        memory[stage] = max(memory.get(stage, 0), peak_rss_mib())
+        return result
+
+    for _ in range(repeat):
+        # A streamed log gets its statistics during the same single pass
+        if streamed:
+            experiment, stats = timed("parse", src.stream_experiment, path, 1, 1)
+            timings["statistics"] = 0.0
+        else:
+            experiment = src.Experiment(*timed("parse", src.read_dwstemp, path, columns))
+            timed("statistics", src.experiment_stats, experiment)
+
+        data_x, data_y = timed("series", experiment.select, settings['x_var'], settings['y_var'], settings['time_unit'])
+
+        def render():
+            view = src.PlotView()
+            view.update(data_x, data_y, settings, experiment.version)
+            view.canvas.draw()
+            return view
+        view = timed("render", render)
+
+        for ext in ("png", "pdf"):
+            timed(f"save_{ext}", src.export_figure, view.fig, [os.path.join(output_dir, f"plot.{ext}")], settings)
+        del view, experiment, data_x, data_y
+
+    queue.put({
+        "streamed": streamed,
+        "timings_s": timings,
+        "peak_rss_mib": memory,
+    })
+    app.quit()
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def machine_info():
+    import matplotlib
+    import numpy
+    import pandas
+
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "pandas": pandas.__version__,
+        "matplotlib": matplotlib.__version__,
+    }
+
+def compare(report, baseline, tolerance):
+    # Print new/old per stage; returns the stages that got slower than the tolerance
+    old = {result["rows"]: result for result in baseline["results"]}
+    regressions = []
+    print(f"\ncompared with {baseline.get('commit') or 'baseline'} ({baseline['created']})")
+    for result in report["results"]:
+        if result["rows"] not in old:
+            continue
+        for stage in STAGES:
+            new_s = result["timings_s"][stage]
+            old_s = old[result["rows"]]["timings_s"].get(stage)
+            if not old_s:
+                continue
+            ratio = new_s / old_s
+            slower = ratio > 1 + tolerance and new_s - old_s > NOISE_FLOOR_S
+            if slower:
+                regressions.append((result["rows"], stage, ratio))
+            print(f"{result['rows']:>12} {stage:<12} {old_s * 1000:>10.1f} -> {new_s * 1000:>10.1f} ms  {ratio:>6.2f}x{'  SLOWER' if slower else ''}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parse, statistics, series, render and save at several log sizes")
+    parser.add_argument("--sizes", default="1e4,1e5,1e6", help="Comma separated row counts, e.g. 1e4,1e6,1e8")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size; the fastest of each stage is kept")
+    parser.add_argument("--data-dir", default=None, help="Keep (and reuse) the synthetic logs here")
+    parser.add_argument("-o", "--output", default=None, help="Write the JSON report here")
+    parser.add_argument("--baseline", default=None, help="Earlier JSON report to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before a stage counts as a regression")
+    args = parser.parse_args()
+
+    sizes = [int(float(size)) for size in args.sizes.split(",")]
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "machine": machine_info(),
+        "repeat": args.repeat,
+        "results": [],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or tmp
+        os.makedirs(data_dir, exist_ok=True)
+        context = multiprocessing.get_context("spawn")
+
+        print(f"{'rows':>12} {'MiB':>8} " + " ".join(f"{stage:>10}" for stage in STAGES) + f" {'peak MiB':>9}")
+        for rows in sizes:
+            path = os.path.join(data_dir, f"synthetic_{rows}.csv")
+            if not os.path.exists(path):
+                synthetic.write_dwstemp(path, rows)
+
+            queue = context.Queue()
+            process = context.Process(target=run_size, args=(path, args.repeat, tmp, queue))
+            process.start()
+            result = queue.get()
+            process.join()
+
+            result.update(rows=rows, file_bytes=os.path.getsize(path))
+            report["results"].append(result)
+            print(f"{rows:>12} {result['file_bytes'] / 2**20:>8.1f} "
+                  + " ".join(f"{result['timings_s'][stage] * 1000:>8.1f}ms" for stage in STAGES)
+                  + f" {max(result['peak_rss_mib'].values()):>9.1f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} stage(s) slower than {1 + args.tolerance:.2f}x the baseline")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# Synthetic DWStemp logs for benchmarks: the same layout as
+# Assets/Example1.csv (cp949 units row, ten-character right-aligned fields,
+# \r\n line endings) with hydrate-cycle-like signals, at any row count.
+#
+#   python benchmarks/synthetic.py /tmp/synthetic.csv --rows 1e7
+
+import argparse
+import time
+
+import numpy as np
+
+HEADER = "RecNo.,Time,Pressure1,Pressure2,Temp.1,Temp.2,Temp. 3,Temp. 4\r\nNo.   ,sec,kgf/㎠,kgf/㎠,℃,℃,℃,℃\r\n"
+
+FIELD_WIDTH = 10
+
+# RecNo., Time, Pressure1, Pressure2, Temp.1, Temp.2, Temp. 3, Temp. 4
+DECIMALS = [0, 0, 2, 2, 2, 2, 2, 2]
+
+LINE_BYTES = len(DECIMALS) * (FIELD_WIDTH + 1) + 1
+
+# One cooling/formation/heating cycle, as in Example1.csv (hours)
+CYCLE_HOURS = 25.0
+
+# Bath temperature over a cycle (hour, raw value = 0.1 ℃)
+BATH_PROFILE = (
+    [0.0, 10.0, 12.5, 14.5, 15.5, 22.5, 24.5, 25.0],
+    [142.0, 25.0, -3.0, -3.0, 309.0, 309.0, 141.0, 142.0],
+)
+
+def fixed_width(values, decimals, width=FIELD_WIDTH):
+    # Right-aligned "%{width}.{decimals}f" of every value, as an (n, width) byte array
+    scaled = np.rint(np.abs(values) * 10**decimals).astype(np.int64)
+    negative = (values < 0) & (scaled > 0)
+    out = np.full((len(values), width), ord(" "), dtype=np.uint8)
+
+    digit = 0
+    signed = ~negative
+    for pos in range(width - 1, -1, -1):
+        if decimals and pos == width - 1 - decimals:
+            out[:, pos] = ord(".")
+            continue
+        # Fraction digits and the first integer digit are always written
+        shown = (scaled > 0) | (digit <= decimals)
+        out[shown, pos] = ord("0") + (scaled[shown] % 10).astype(np.uint8)
+        sign = ~shown & ~signed
+        out[sign, pos] = ord("-")
+        signed |= sign
+        scaled //= 10
+        digit += 1
+    return out
+
+def format_rows(columns):
+    # One block of CSV lines from equally long columns
+    lines = np.empty((len(columns[0]), LINE_BYTES), dtype=np.uint8)
+    for k, (values, decimals) in enumerate(zip(columns, DECIMALS)):
+        start = k * (FIELD_WIDTH + 1)
+        lines[:, start:start + FIELD_WIDTH] = fixed_width(values, decimals)
+        lines[:, start + FIELD_WIDTH] = ord(",")
+    lines[:, -2:] = [ord("\r"), ord("\n")]
+    return lines.tobytes()
+
+def cycle_random(cycle, salt, seed):
+    # Repeatable uniform [0, 1) per cycle, whichever block the cycle falls in
+    value = np.sin(cycle * 12.9898 + salt * 78.233 + seed) * 43758.5453
+    return value - np.floor(value)
+
+def signals(first_row, rows, interval, seed):
+    # Columns of rows first_row .. first_row + rows - 1
+    rng = np.random.default_rng([seed, first_row])
+    rec = np.arange(first_row + 1, first_row + rows + 1, dtype=np.float64)
+    time_sec = rec * interval
+    hours = time_sec / 3600
+    cycle = np.floor(hours / CYCLE_HOURS)
+    tau = hours - cycle * CYCLE_HOURS
+
+    # Bath follows the profile; the reactor lags it a little and is noisier
+    bath = np.interp(tau, *BATH_PROFILE) + rng.normal(0, 0.3, rows)
+    reactor = np.interp(tau - 0.1, *BATH_PROFILE)
+
+    # Hydrate nucleation somewhere on the way down: an exotherm in the
+    # reactor and gas uptake that pulls the pressure down until heating
+    nucleation = 9.5 + 1.5 * cycle_random(cycle, 1, seed)
+    depth = 0.35 + 0.12 * cycle_random(cycle, 2, seed)
+    since = np.maximum(tau - nucleation, 0)
+    formed = tau >= nucleation
+    reactor += np.where(formed, 15 * np.exp(-since / 0.4) * (1 - np.exp(-since / 0.05)), 0)
+    uptake = np.where(formed, 1 - np.exp(-since / 0.7), 0)
+    uptake *= np.where(tau > 14.5, np.exp(-np.maximum(tau - 14.5, 0) / 0.25), 1)
+
+    # Pressure of the free gas tracks the reactor temperature, with a slow leak while hot
+    leak = 0.015 * np.clip(tau - 15.5, 0, 7)
+    pressure = (31.5 + 0.0248 * reactor) * (1 - depth * uptake) - leak
+
+    reactor = np.round(reactor + rng.normal(0, 0.5, rows), 1)
+    pressure = np.round(pressure + rng.normal(0, 0.02, rows), 2)
+    bath = np.round(bath, 1)
+    room = np.round(230 + 15 * np.sin(2 * np.pi * hours / 24) + rng.normal(0, 0.5, rows), 1)
+    unused = np.zeros(rows)
+    return [rec, time_sec, pressure, unused, reactor, bath, room, unused]
+
+def write_dwstemp(path, rows, interval=60, seed=0, block_rows=1_000_000):
+    # Write a synthetic log of `rows` records, one block at a time; returns its size in bytes
+    rows = int(rows)
+    with open(path, "wb") as f:
+        f.write(HEADER.encode("cp949"))
+        for first_row in range(0, rows, block_rows):
+            f.write(format_rows(signals(first_row, min(block_rows, rows - first_row), interval, seed)))
+        return f.tell()
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic DWStemp log")
+    parser.add_argument("path")
+    parser.add_argument("--rows", type=float, default=1e6, help="Number of records, e.g. 1e4 .. 1e8")
+    parser.add_argument("--interval", type=int, default=60, help="Seconds between records")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    size = write_dwstemp(args.path, args.rows, args.interval, args.seed)
+    print(f"wrote {int(args.rows)} rows, {size / 2**20:.1f} MiB in {time.perf_counter() - start:.1f} s")
+
+if __name__ == "__main__":
+    main()
@@ -1,65 +1,3097 @@
-from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, QTextEdit, QCheckBox, QLineEdit, QFileDialog, QWidget, QMessageBox, QDialog, QFrame
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, QTextEdit, QCheckBox, QLineEdit, QFileDialog, QWidget, QMessageBox, QDialog, QFrame, QProgressBar, QInputDialog, QTableView, QHeaderView
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 from PyQt6 import QtGui, QtCore
 from PyQt6.QtGui import QPixmap
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+import argparse
+import collections
+import contextlib
+import datetime
+import cProfile
+import glob
+import hashlib
+import importlib.util
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import pickle
+import shutil
 import sys
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib import rcParams
+import tempfile
+import threading
+import time
+import urllib.parse
+import numpy as np
+
+# pandas and matplotlib are imported where they are first needed (and warmed
+# up on a background thread once the window is shown), so the window does not
+# wait for them
+
+# Fonts to try, in order; the first installed one is used
+PREFERRED_FONTS = ['SF Pro Display', 'Arial']
+
+_style_lock = threading.Lock()
+_style_applied = False
+
+def resolve_font():
+    # Look the preferred fonts up once in the font cache instead of letting
+    # every draw fall back through findfont
+    from matplotlib import font_manager
+    installed = {font.name for font in font_manager.fontManager.ttflist}
+    for name in PREFERRED_FONTS:
+        if name in installed:
+            return name
+    print("ERROR Note that Arial and SF Pro are not installed in the computer. The program will use the default font.")
+    return None
+
+def warm_up():
+    # Import the heavy modules and resolve the style ahead of the first load/plot
+    import pandas
+    import matplotlib.figure
+    import matplotlib.backends.backend_agg
+    import matplotlib.backends.backend_qtagg
+    rcparams()
 
 def rcparams():
+    # Applied once per process; later calls return straight away
+    global _style_applied
+    with _style_lock:
+        if _style_applied:
+            return
+        apply_style()
+        _style_applied = True
+
+def apply_style():
+    from matplotlib import rcParams
+
     rcParams['figure.figsize'] = 5, 4
     rcParams['font.family'] = 'sans-serif'
 
     # Check whether Arial or SF Pro Display are installed in the computer
+    font = resolve_font()
+    if font is not None:
+        rcParams['font.sans-serif'] = [font] + [name for name in rcParams['font.sans-serif'] if name != font]
+
+    # Label should be far away from the axes
+    rcParams['axes.labelpad'] = 8
+    rcParams['xtick.major.pad'] = 7
+    rcParams['ytick.major.pad'] = 7
+
+    # Add minor ticks
+    rcParams['xtick.minor.visible'] = True
+    rcParams['ytick.minor.visible'] = True
+
+    # Tick width
+    rcParams['xtick.major.width'] = 1
+    rcParams['ytick.major.width'] = 1
+    rcParams['xtick.minor.width'] = 0.5
+    rcParams['ytick.minor.width'] = 0.5
+
+    # Tick length
+    rcParams['xtick.major.size'] = 5
+    rcParams['ytick.major.size'] = 5
+    rcParams['xtick.minor.size'] = 3
+    rcParams['ytick.minor.size'] = 3
+
+    # Tick color
+    rcParams['xtick.color'] = 'black'
+    rcParams['ytick.color'] = 'black'
+
+    rcParams['font.size'] = 14
+    rcParams['axes.titlepad'] = 10
+    rcParams['axes.titleweight'] = 'normal'
+    rcParams['axes.titlesize'] = 18
+
+    # Axes settings
+    rcParams['axes.labelweight'] = 'normal'
+    rcParams['xtick.labelsize'] = 12
+    rcParams['ytick.labelsize'] = 12
+    rcParams['axes.labelsize'] = 16
+    rcParams['xtick.direction'] = 'in'
+    rcParams['ytick.direction'] = 'in'
+
+# Map the GUI choices (Korean) to the keys used by the headless pipeline
+VARIABLE_KEYS = {'시간': 'time', '온도': 'temperature', '압력': 'pressure', '기체 소모량': 'uptake'}
+TIME_UNIT_KEYS = {'초': 'sec', '분': 'min', '시간': 'hr'}
+PLOT_STYLE_KEYS = {'선': 'line', '점': 'scatter'}
+DECIMATION_KEYS = {'최소/최대': 'minmax', 'LTTB': 'lttb', '사용 안 함': 'none'}
+RESAMPLE_KEYS = {'원본': None, '1분': 60, '10분': 600, '1시간': 3600}
+AGGREGATE_KEYS = {'평균': 'mean', '중앙값': 'median', '최소': 'min', '최대': 'max', '이동 평균': 'rolling'}
+LAYOUT_KEYS = {'한 채널': 'single', '모든 채널 (위아래로)': 'subplots', '압력/온도 (양쪽 Y축)': 'twin'}
+
+# Default axis labels for the headless pipeline
+VARIABLE_LABELS = {'time': 'Time', 'temperature': 'Temperature', 'pressure': 'Pressure', 'moles': 'Gas (mol)', 'uptake': 'Gas uptake (mol)'}
+TIME_UNIT_LABELS = {'sec': 'Time (sec)', 'min': 'Time (min)', 'hr': 'Time (hr)'}
+
+# Same defaults as the GUI widgets
+DEFAULT_SETTINGS = {
+    'pressure_sensor_num': 1,
+    'temperature_sensor_num': 1,
+    'divide_pressure_by': 1.0,
+    'divide_temp_by': 10.0,
+    'x_var': 'time',
+    'y_var': 'temperature',
+    'x_label': None,
+    'y_label': None,
+    'time_unit': 'sec',
+    'x_scale': None,
+    'y_scale': None,
+    'dpi': 350,
+    'transparent': False,
+    'line_width': 2,
+    'plot_style': 'line',
+    'decimation': 'minmax',
+    'exact_export': False,
+    'rasterize': False,
+    'simplify_threshold': 1 / 9,
+    'agg_chunksize': 20000,
+    'events': False,
+    'time_range': None,
+    'layout': 'single',
+    'resample': None,
+    'aggregate': 'mean',
+    'gas': 'CH4',
+    'gas_volume': 1.0,
+}
+
+# DWStemp column positions: RecNo., Time, Pressure1, Pressure2, Temp.1 ... Temp. 4
+TIME_COLUMN = 1
+
+def pressure_column(sensor_num):
+    return sensor_num + 1
+
+def temperature_column(sensor_num):
+    return sensor_num + 3
+
+# Timing instrumentation. An operation (load, plot, save) is a Trace made
+# active on the thread doing the work, and span() records one named stage of
+# it with its row and byte counts. With no active trace a span costs one
+# thread-local lookup.
+TIMING_LOG_ENV = "DWSPAPYRUS_TIMING_LOG"
+PROFILE_DIR_ENV = "DWSPAPYRUS_PROFILE_DIR"
+
+_trace_state = threading.local()
+
+def format_bytes(size):
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.2f} GiB"
+
+class Trace:
+    # Stages of one operation, possibly recorded on several threads in turn
+    # (parsed on the pool, previewed on the GUI thread). With profile=True a
+    # cProfile capture runs whenever the trace is active.
+    def __init__(self, operation, subject=None, profile=False):
+        self.operation = operation
+        self.subject = subject
+        self.started = time.time()
+        self.start = time.perf_counter()
+        self.total = None
+        self.spans = []
+        self.error = None
+        self.profiler = cProfile.Profile() if profile else None
+        self.profile_path = None
+
+    @contextlib.contextmanager
+    def activate(self):
+        previous = getattr(_trace_state, "trace", None)
+        _trace_state.trace = self
+        if self.profiler is not None:
+            self.profiler.enable()
+        try:
+            yield self
+        finally:
+            if self.profiler is not None:
+                self.profiler.disable()
+            _trace_state.trace = previous
+
+    def add(self, name, seconds, fields):
+        self.spans.append({'name': name, 'seconds': seconds, **fields})
+
+    def finish(self, error=None):
+        # Stop the clock, then append the JSON line and dump the profile if asked for
+        self.total = time.perf_counter() - self.start
+        self.error = str(error) if error is not None else None
+
+        log_path = os.environ.get(TIMING_LOG_ENV)
+        try:
+            if log_path:
+                with open(log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(self.record(), ensure_ascii=False) + "\n")
+            if self.profiler is not None:
+                profile_dir = os.environ.get(PROFILE_DIR_ENV) or tempfile.gettempdir()
+                self.profile_path = os.path.join(profile_dir, f"dwspapyrus-{self.operation}-{time.strftime('%Y%m%d-%H%M%S')}.prof")
+                self.profiler.dump_stats(self.profile_path)
+        except OSError as e:
+            # Diagnostics must never break the operation they describe
+            print(f"WARNING Could not write timing output: {e}", file=sys.stderr)
+            self.profile_path = None
+        return self
+
+    def record(self):
+        record = {
+            'operation': self.operation,
+            'started': time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            'total_s': round(self.total, 6),
+            'file': self.subject,
+            'spans': [dict(stage, seconds=round(stage['seconds'], 6)) for stage in self.spans],
+        }
+        if self.error is not None:
+            record['error'] = self.error
+        return record
+
+    def describe(self, stage):
+        details = []
+        if 'rows' in stage:
+            details.append(f"{stage['rows']:,} rows")
+        if 'bytes' in stage:
+            details.append(format_bytes(stage['bytes']))
+        return f"{stage['name']} {stage['seconds']:.2f} s" + (f" ({', '.join(details)})" if details else "")
+
+    def summary(self):
+        # One line for the status bar, e.g. "load 0.52 s | parse 0.41 s (8,028 rows, 696.5 KiB), stats 0.00 s"
+        return f"{self.operation} {self.total:.2f} s | " + ", ".join(self.describe(stage) for stage in self.spans)
+
+@contextlib.contextmanager
+def traced(operation, subject=None):
+    # A trace active for the duration of a block, finished (and logged) after it
+    trace = Trace(operation, subject)
+    try:
+        with trace.activate():
+            yield trace
+    except BaseException as e:
+        trace.finish(e)
+        raise
+    trace.finish()
+
+@contextlib.contextmanager
+def span(name, **fields):
+    # Time one stage of the active trace; rows/bytes known only afterwards
+    # can be filled in on the yielded dict
+    trace = getattr(_trace_state, "trace", None)
+    if trace is None:
+        yield fields
+        return
+    start = time.perf_counter()
+    try:
+        yield fields
+    finally:
+        trace.add(name, time.perf_counter() - start, fields)
+
+# Use the multithreaded pyarrow CSV engine when it is installed
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+
+def read_dwstemp_header(file_path):
+    # DWStemp files start with a names row and a cp949 units row
+    with open(file_path, encoding="cp949", newline="") as f:
+        names = [name.strip() for name in f.readline().split(",")]
+        units = [unit.strip() for unit in f.readline().split(",")]
+    return names, units
+
+def read_dwstemp(file_path, columns, engine=None):
+    # Parse only the requested column positions, straight into float64 arrays.
+    # The fields are whitespace padded, which the float parser skips on its own.
+    import pandas as pd
+
+    usecols = sorted(set(columns))
+    df = pd.read_csv(file_path, encoding="cp949", header=None, skiprows=2, usecols=usecols, dtype="float64", engine=engine or CSV_ENGINE)
+
+    # Columns come back in file order, whatever order they were asked in
+    arrays = {column: np.ascontiguousarray(df.iloc[:, i].to_numpy()) for i, column in enumerate(usecols)}
+    return [arrays[column] for column in columns]
+
+# Parsed-log cache settings (environment variables so worker processes inherit them)
+CACHE_DIR_ENV = "DWSPAPYRUS_CACHE_DIR"
+CACHE_SIZE_ENV = "DWSPAPYRUS_CACHE_MB"
+CACHE_DISABLE_ENV = "DWSPAPYRUS_NO_CACHE"
+DEFAULT_CACHE_MB = 1024
+
+# Rendered previews and export bytes kept in memory (see RenderCache)
+RENDER_CACHE_ENV = "DWSPAPYRUS_RENDER_CACHE_MB"
+DEFAULT_RENDER_CACHE_MB = 256
+
+# Bytes read from each end of a file for its content fingerprint
+FINGERPRINT_BYTES = 1 << 16
+
+def file_fingerprint(file_path):
+    # Hash the size plus the first and last blocks; cheap even for huge logs
+    size = os.path.getsize(file_path)
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(file_path, "rb") as f:
+        digest.update(f.read(FINGERPRINT_BYTES))
+        if size > FINGERPRINT_BYTES:
+            f.seek(max(size - FINGERPRINT_BYTES, FINGERPRINT_BYTES))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def content_hash(file_path, block_bytes=1 << 20):
+    # Hash of every byte, unlike file_fingerprint: an edit anywhere in the log
+    # changes it, while a touched or re-copied log hashes the same
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_bytes), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def default_cache_dir():
+    return os.environ.get(CACHE_DIR_ENV) or os.path.join(os.path.expanduser("~"), ".cache", "dwspapyrus")
+
+class LogCache:
+    # On-disk cache of parsed DWStemp columns. Every file gets a directory
+    # named after (path, size, mtime, fingerprint) holding one .npy per
+    # column, which is memory-mapped back on a hit. Directories are evicted
+    # least recently used first once the cache grows past max_bytes.
+    def __init__(self, cache_dir=None, max_bytes=None):
+        if cache_dir is None:
+            cache_dir = default_cache_dir()
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_MB)) * 2**20)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key(self, file_path):
+        stat = os.stat(file_path)
+        ident = f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}|{file_fingerprint(file_path)}"
+        return hashlib.blake2b(ident.encode("utf-8"), digest_size=16).hexdigest()
+
+    def entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def load(self, key, columns):
+        # Return {column: array} for the columns already cached
+        entry = self.entry_dir(key)
+        arrays = {}
+        for column in columns:
+            path = os.path.join(entry, f"{column}.npy")
+            if os.path.exists(path):
+                arrays[column] = np.load(path, mmap_mode="r")
+        if arrays:
+            # Mark the entry as recently used
+            os.utime(entry)
+        return arrays
+
+    def store(self, key, arrays):
+        entry = self.entry_dir(key)
+        os.makedirs(entry, exist_ok=True)
+        for column, array in arrays.items():
+            # Write then rename, so a crash or a second process never sees half a file
+            path = os.path.join(entry, f"{column}.npy")
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            entry = os.path.join(self.cache_dir, name)
+            if not os.path.isdir(entry):
+                continue
+            size = sum(os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry))
+            entries.append((os.path.getmtime(entry), size, entry))
+            total += size
+
+        # Oldest first
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                shutil.rmtree(entry)
+                total -= size
+            except OSError:
+                # Still memory-mapped somewhere (Windows); try again next time
+                pass
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+_log_cache = None
+
+def get_log_cache():
+    # Shared cache configured from the environment, or None when disabled
+    global _log_cache
+    if os.environ.get(CACHE_DISABLE_ENV):
+        return None
+    if _log_cache is None:
+        _log_cache = LogCache()
+    return _log_cache
+
+def read_dwstemp_cached(file_path, columns, cache=None, progress=None, cancelled=None):
+    def parse(columns):
+        with span("parse", bytes=os.path.getsize(file_path)) as fields:
+            if progress is None and cancelled is None:
+                arrays = read_dwstemp(file_path, columns)
+            else:
+                arrays = read_dwstemp_blocks(file_path, columns, progress, cancelled)
+            fields['rows'] = len(arrays[0])
+        return arrays
+
+    cache = cache or get_log_cache()
+    if cache is None:
+        return parse(columns)
+
     try:
-        rcParams['font.sans-serif'] = ['SF Pro Display']
-    except:
+        with span("cache") as fields:
+            key = cache.key(file_path)
+            arrays = cache.load(key, columns)
+            if arrays:
+                fields['rows'] = len(next(iter(arrays.values())))
+    except OSError:
+        return parse(columns)
+
+    # Parse only what the cache does not have yet
+    missing = [column for column in dict.fromkeys(columns) if column not in arrays]
+    if missing:
+        parsed = dict(zip(missing, parse(missing)))
+        try:
+            cache.store(key, parsed)
+        except OSError:
+            # A read-only or full cache directory should never break loading
+            pass
+        arrays.update(parsed)
+    return [arrays[column] for column in columns]
+
+def load_dwstemp(file_path, pressure_sensor_num, temperature_sensor_num):
+    # Get the raw time, pressure and temperature data
+    time_sec, pressure, temperature = read_dwstemp_cached(file_path, [TIME_COLUMN, pressure_column(pressure_sensor_num), temperature_column(temperature_sensor_num)])
+    return time_sec, pressure, temperature
+
+# How often a followed log is polled for new rows
+FOLLOW_INTERVAL_MS = 1000
+
+# A poll with more unread bytes than this (a stall, or the log replaced and
+# read again from the top) catches up on the thread pool, not the GUI thread
+FOLLOW_INLINE_BYTES = 1 << 22
+
+# Bytes read per step while following a growing log
+TAIL_BLOCK_BYTES = 1 << 24
+
+class LoadCancelled(Exception):
+    pass
+
+def parse_rows(data, columns):
+    # Parse complete CSV rows (no header) held in memory into float64 arrays
+    import pandas as pd
+
+    usecols = sorted(set(columns))
+    df = pd.read_csv(io.BytesIO(data), header=None, usecols=usecols, dtype="float64", engine=CSV_ENGINE)
+    arrays = {column: df.iloc[:, i].to_numpy() for i, column in enumerate(usecols)}
+    return [arrays[column] for column in columns]
+
+class LogTail:
+    # Follows a DWStemp CSV that is still being written. Remembers the byte
+    # offset already consumed, parses only complete rows appended since the
+    # last poll, and appends them to buffers that grow by doubling, so each
+    # poll costs the same however long the run has been going.
+    def __init__(self, file_path, columns):
+        self.file_path = file_path
+        self.columns = list(columns)
+        self.reset()
+
+    def reset(self):
+        self.offset = 0
+        self.size = 0
+        self.buffers = np.empty((len(self.columns), 1024))
+
+    def arrays(self):
+        return [buffer[:self.size] for buffer in self.buffers]
+
+    def append(self, rows):
+        n = len(rows[0])
+        if self.size + n > self.buffers.shape[1]:
+            grown = np.empty((len(self.columns), max(2 * self.buffers.shape[1], self.size + n)))
+            grown[:, :self.size] = self.buffers[:, :self.size]
+            self.buffers = grown
+        for buffer, values in zip(self.buffers, rows):
+            buffer[self.size:self.size + n] = values
+        self.size += n
+
+    def poll(self, final=False, progress=None, cancelled=None):
+        # Returns the number of new rows. With final=True a last line without
+        # a newline counts as complete (the file is not being written any more).
+        file_size = os.path.getsize(self.file_path)
+        if file_size < self.offset:
+            # Truncated or replaced: start over
+            self.reset()
+        if file_size == self.offset:
+            return 0
+
+        start = self.size
+        for self.offset, file_size, rows in iter_row_blocks(self.file_path, self.columns, self.offset, final):
+            if rows is not None:
+                self.append(rows)
+            if progress is not None:
+                progress(self.offset, file_size)
+            if cancelled is not None and cancelled():
+                raise LoadCancelled()
+        return self.size - start
+
+def iter_row_blocks(file_path, columns, offset=0, final=False, block_bytes=TAIL_BLOCK_BYTES):
+    # Parse a DWStemp CSV from a byte offset one bounded block at a time.
+    # Yields (offset after the block, file size, arrays or None for a block
+    # holding only the header). Stops at the last complete line unless final.
+    file_size = os.path.getsize(file_path)
+    with open(file_path, "rb") as f:
+        while True:
+            f.seek(offset)
+            data = f.read(block_bytes)
+
+            # Stop at the last complete line; the rest is still being written
+            end = data.rfind(b"\n") + 1
+            if final and offset + len(data) >= file_size:
+                end = len(data)
+            if end == 0:
+                return
+            body = data[:end]
+
+            if offset == 0:
+                # Skip the names row and the units row
+                header_end = body.find(b"\n", body.find(b"\n") + 1) + 1
+                if header_end == 0:
+                    return
+                body = body[header_end:]
+
+            offset += end
+            yield offset, file_size, parse_rows(body, columns) if body.strip() else None
+
+def read_dwstemp_blocks(file_path, columns, progress=None, cancelled=None):
+    # Same result as read_dwstemp, parsed a block at a time so the caller can
+    # show progress and cancel between blocks
+    tail = LogTail(file_path, columns)
+    tail.poll(final=True, progress=progress, cancelled=cancelled)
+    return [np.ascontiguousarray(array) for array in tail.arrays()]
+
+# Sparse Time index: the Time value and byte offset of every
+# TIME_INDEX_STRIDE-th record, kept in the cache directory
+TIME_INDEX_STRIDE = 1024
+TIME_INDEX_SUFFIX = ".tidx"
+TIME_INDEX_MAGIC = b"DWSTIDX1"
+
+# Bytes at the start of a log whose digest identifies it in its index
+TIME_INDEX_HEAD_BYTES = 4096
+
+TIME_INDEX_ENTRY = np.dtype([('time', '<f8'), ('offset', '<i8')])
+
+class TimeIndex:
+    # Index file layout: magic, stride, number of head bytes hashed and their
+    # digest, then (time, offset) entries appended as the log grows. The file
+    # lives in the cache directory, named after the log's path and head
+    # digest; unlike file_fingerprint, those stay the same while the log
+    # grows, so a followed log keeps extending one index. A log that was
+    # replaced or truncated gets a fresh index. With the cache disabled, or
+    # when the file cannot be written, the index is kept in memory only.
+    def __init__(self, file_path, stride=TIME_INDEX_STRIDE):
+        self.file_path = file_path
+        self.stride = stride
+        self.index_path = self.cache_path()
+        self.entries = np.empty(0, dtype=TIME_INDEX_ENTRY)
+
+    def cache_path(self):
+        if os.environ.get(CACHE_DISABLE_ENV):
+            return None
+        length = min(os.path.getsize(self.file_path), TIME_INDEX_HEAD_BYTES)
+        name = hashlib.blake2b(os.path.abspath(self.file_path).encode("utf-8") + self.head(length), digest_size=16).hexdigest()
+        return os.path.join(default_cache_dir(), name + TIME_INDEX_SUFFIX)
+
+    def head(self, length):
+        with open(self.file_path, "rb") as f:
+            return hashlib.blake2b(f.read(length), digest_size=16).digest()
+
+    def header(self):
+        length = min(os.path.getsize(self.file_path), TIME_INDEX_HEAD_BYTES)
+        return TIME_INDEX_MAGIC + np.array([self.stride, length], dtype="<i8").tobytes() + self.head(length)
+
+    def load(self):
+        # Entries of an index file that still matches the log, else none
+        data = b""
+        if self.index_path is not None:
+            try:
+                with open(self.index_path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                pass
+
+        self.entries = np.empty(0, dtype=TIME_INDEX_ENTRY)
+        header_size = len(TIME_INDEX_MAGIC) + 16 + 16
+        if len(data) < header_size or not data.startswith(TIME_INDEX_MAGIC):
+            return self
+        stride, length = np.frombuffer(data[len(TIME_INDEX_MAGIC):len(TIME_INDEX_MAGIC) + 16], dtype="<i8")
+        body = data[header_size:]
+        if stride != self.stride or self.head(int(length)) != data[header_size - 16:header_size]:
+            return self
+        entries = np.frombuffer(body[:len(body) // TIME_INDEX_ENTRY.itemsize * TIME_INDEX_ENTRY.itemsize], dtype=TIME_INDEX_ENTRY)
+        if len(entries) and entries['offset'][-1] >= os.path.getsize(self.file_path):
+            return self
+        self.entries = entries.copy()
+        return self
+
+    def update(self, block_bytes=TAIL_BLOCK_BYTES):
+        # Index the complete lines added since the last entry; returns the number of new entries
+        if len(self.entries):
+            offset = int(self.entries['offset'][-1])
+            record = (len(self.entries) - 1) * self.stride
+        else:
+            with open(self.file_path, "rb") as f:
+                head = f.read(block_bytes)
+            offset = head.find(b"\n", head.find(b"\n") + 1) + 1
+            record = 0
+            if offset == 0:
+                return 0
+
+        new = []
+        indexed = len(self.entries) * self.stride
+        with open(self.file_path, "rb") as f:
+            while True:
+                f.seek(offset)
+                data = f.read(block_bytes)
+                ends = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord("\n"))
+                if not len(ends):
+                    break
+
+                # Every stride-th complete line not indexed yet
+                starts = np.concatenate(([0], ends[:-1] + 1))
+                records = record + np.arange(len(starts))
+                pick = (records % self.stride == 0) & (records >= indexed)
+                for start, end in zip(starts[pick], ends[pick]):
+                    new.append((float(data[start:end].split(b",")[TIME_COLUMN]), offset + int(start)))
+                record += len(starts)
+                offset += int(ends[-1]) + 1
+
+        if new:
+            new = np.array(new, dtype=TIME_INDEX_ENTRY)
+            self.append(new)
+            self.entries = np.concatenate([self.entries, new])
+        return len(new)
+
+    def append(self, new):
+        # Start (or restart) the index file with a header, then append entries
+        if self.index_path is None:
+            return
+        try:
+            if not len(self.entries) or not os.path.exists(self.index_path):
+                os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+                with open(self.index_path, "wb") as f:
+                    f.write(self.header())
+                    f.write(self.entries.tobytes())
+            with open(self.index_path, "ab") as f:
+                f.write(new.tobytes())
+        except OSError as e:
+            # Only slower next time: the entries are still used for this read
+            print(f"WARNING Could not write the time index {self.index_path}: {e}", file=sys.stderr)
+            self.index_path = None
+
+    def byte_range(self, start_time, end_time):
+        # Bytes holding every row with start_time <= Time <= end_time: from
+        # the last entry at or before start_time to the first one after
+        # end_time (None: to the end of the file)
+        times, offsets = self.entries['time'], self.entries['offset']
+        if np.any(times[1:] < times[:-1]):
+            # Not in time order after all; only a full read is safe
+            return int(offsets[0]), None
+        first = max(np.searchsorted(times, start_time, side="right") - 1, 0)
+        last = np.searchsorted(times, end_time, side="right")
+        return int(offsets[first]), int(offsets[last]) if last < len(offsets) else None
+
+def open_time_index(file_path):
+    # The log's index, brought up to date with whatever was appended since
+    index = TimeIndex(file_path).load()
+    with span("index") as fields:
+        fields['rows'] = index.update() * index.stride
+    return index
+
+def read_dwstemp_range(file_path, columns, start_time, end_time):
+    # Rows with start_time <= Time (sec) <= end_time, reading only the bytes
+    # the time index points at: about as costly as a log of just that window
+    index = open_time_index(file_path)
+    usecols = sorted(set(columns) | {TIME_COLUMN})
+    if not len(index.entries):
+        return [np.empty(0) for _ in columns]
+
+    start, end = index.byte_range(start_time, end_time)
+    with span("parse") as fields:
+        with open(file_path, "rb") as f:
+            f.seek(start)
+            data = f.read(-1 if end is None else end - start)
+        # Leave out a last line that is still being written
+        data = data[:data.rfind(b"\n") + 1]
+        fields['bytes'] = len(data)
+        if not data:
+            return [np.empty(0) for _ in columns]
+        arrays = dict(zip(usecols, parse_rows(data, usecols)))
+
+        time_sec = arrays[TIME_COLUMN]
+        keep = (time_sec >= start_time) & (time_sec <= end_time)
+        fields['rows'] = int(np.count_nonzero(keep))
+    return [np.ascontiguousarray(arrays[column][keep]) for column in columns]
+
+# Seconds per time unit
+TIME_UNIT_SECONDS = {'sec': 1.0, 'min': 60.0, 'hr': 3600.0}
+
+def sample_step(time_sec):
+    # Typical seconds between records (from the head, so huge logs stay cheap)
+    return float(np.median(np.diff(time_sec[:100001]))) if len(time_sec) > 1 else 0.0
+
+def resample_spec(settings):
+    # (bin seconds, statistic) from the settings, or None for the raw series
+    if not settings.get('resample'):
+        return None
+    return float(settings['resample']), settings.get('aggregate', 'mean')
+
+def time_bins(time_sec, rule):
+    # Rows grouped into bins of `rule` seconds aligned to multiples of it:
+    # the order that brings each bin together (None when time is sorted
+    # already), where every bin starts in that order, and the bin centres
+    ids = np.floor(time_sec / rule)
+    order = None
+    if np.any(ids[1:] < ids[:-1]):
+        order = np.argsort(ids, kind="stable")
+        ids = ids[order]
+    starts = np.flatnonzero(np.concatenate(([True], ids[1:] != ids[:-1]))) if len(ids) else np.empty(0, dtype=np.intp)
+    return order, starts, (ids[starts] + 0.5) * rule
+
+def bin_aggregate(values, bins, stat):
+    # Mean, median, min or max of every bin in one pass of reduceat (NaNs skipped)
+    order, starts, _ = bins
+    if order is not None:
+        values = values[order]
+    if not len(starts):
+        return np.empty(0)
+
+    valid = ~np.isnan(values)
+    counts = np.add.reduceat(valid.astype(np.int64), starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if stat == 'min':
+            out = np.minimum.reduceat(np.where(valid, values, np.inf), starts)
+        elif stat == 'max':
+            out = np.maximum.reduceat(np.where(valid, values, -np.inf), starts)
+        elif stat == 'median':
+            # Sorting by (bin, value) puts each bin's values in order, NaNs last
+            bin_ids = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, len(values))))
+            ordered = values[np.lexsort((values, bin_ids))]
+            out = (ordered[starts + np.maximum(counts - 1, 0) // 2] + ordered[starts + counts // 2]) / 2
+        else:
+            out = np.add.reduceat(np.where(valid, values, 0.0), starts) / counts
+    out[counts == 0] = np.nan
+    return out
+
+def rolling_mean(time_sec, values, rule):
+    # Centred moving average over `rule` seconds worth of records, narrower
+    # at the ends; NaNs are skipped. Two cumulative sums, O(n).
+    n = len(values)
+    step = sample_step(time_sec)
+    window = max(int(round(rule / step)), 1) if step > 0 else 1
+    valid = ~np.isnan(values)
+
+    # Row i averages rows i - window // 2 .. i + (window - 1) // 2 (as pandas'
+    # centred windows); the cumulative sums are padded with their end values
+    # so that is one slice
+    pad = (window // 2, (window - 1) // 2)
+    sums = np.pad(np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0)))), pad, mode="edge")
+    counts = np.pad(np.concatenate(([0], np.cumsum(valid))), pad, mode="edge")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (sums[window:window + n] - sums[:n]) / (counts[window:window + n] - counts[:n])
+
+def resample_series(time_sec, values, rule, stat, bins=None):
+    # (time, values) of one channel after aggregation; rolling keeps every row
+    if stat == 'rolling':
+        return time_sec, rolling_mean(time_sec, values, rule)
+    bins = bins if bins is not None else time_bins(time_sec, rule)
+    return bins[2], bin_aggregate(values, bins, stat)
+
+# Critical temperature (K), critical pressure (Pa) and acentric factor
+GAS_PROPERTIES = {
+    'CH4': (190.56, 4.599e6, 0.011),
+    'C2H6': (305.32, 4.872e6, 0.099),
+    'C3H8': (369.83, 4.248e6, 0.152),
+    'CO2': (304.13, 7.377e6, 0.225),
+    'N2': (126.19, 3.396e6, 0.037),
+}
+
+GAS_CONSTANT = 8.314462618
+
+# Divided pressure and temperature are taken as absolute kgf/cm2 and degC
+PRESSURE_UNIT_PA = 98066.5
+CELSIUS_ZERO_K = 273.15
+
+def cubic_largest_root(a2, a1, a0):
+    # Largest real root of z^3 + a2 z^2 + a1 z + a0 for whole arrays at once:
+    # Cardano where there is one real root, the trigonometric form where there are three
+    # Cubes are written as products: x**3 of negative arrays goes through the slow pow()
+    shift = -a2 / 3
+    p3 = (a1 - a2 * a2 / 3) / 3
+    half_q = a2 * a2 * a2 / 27 - a2 * a1 / 6 + a0 / 2
+    disc = half_q * half_q + p3 * p3 * p3
+    roots = np.empty_like(disc)
+
+    one = disc > 0
+    root = np.sqrt(disc[one])
+    roots[one] = np.cbrt(root - half_q[one]) - np.cbrt(root + half_q[one])
+
+    three = ~one
+    m = np.sqrt(np.maximum(-p3[three], 0))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cos_arg = np.clip(np.where(m > 0, -half_q[three] / (m * m * m), 0), -1, 1)
+    roots[three] = 2 * m * np.cos(np.arccos(cos_arg) / 3)
+    return roots + shift
+
+def peng_robinson_z(pressure_pa, temperature_k, gas='CH4'):
+    # Compressibility factor of the gas phase (largest root) from the Peng-Robinson EOS
+    tc, pc, omega = GAS_PROPERTIES[gas]
+    kappa = 0.37464 + 1.54226 * omega - 0.26992 * omega**2
+    alpha = (1 + kappa * (1 - np.sqrt(temperature_k / tc)))**2
+    rt = GAS_CONSTANT * temperature_k
+    a = 0.45724 * (GAS_CONSTANT * tc)**2 / pc * alpha
+    b = 0.07780 * GAS_CONSTANT * tc / pc
+    A = a * pressure_pa / (rt * rt)
+    B = b * pressure_pa / rt
+    return cubic_largest_root(B - 1, A - B * (3 * B + 2), B * (B * (B + 1) - A))
+
+# Rows per block of the EOS solve; small blocks keep the temporaries in cache
+EOS_BLOCK_ROWS = 1 << 14
+
+def gas_moles(pressure, temperature, volume_l, gas='CH4'):
+    # Moles of gas in volume_l litres at the divided (kgf/cm2, degC) readings: n = PV / ZRT
+    moles = np.empty(len(pressure))
+    for start in range(0, len(pressure), EOS_BLOCK_ROWS):
+        pressure_pa = pressure[start:start + EOS_BLOCK_ROWS] * PRESSURE_UNIT_PA
+        temperature_k = temperature[start:start + EOS_BLOCK_ROWS] + CELSIUS_ZERO_K
+        moles[start:start + EOS_BLOCK_ROWS] = pressure_pa * (volume_l * 1e-3) / (peng_robinson_z(pressure_pa, temperature_k, gas) * GAS_CONSTANT * temperature_k)
+    return moles
+
+def gas_uptake(moles):
+    # Moles consumed since the first reading
+    finite = np.flatnonzero(np.isfinite(moles))
+    return moles[finite[0]] - moles if len(finite) else np.full(len(moles), np.nan)
+
+_experiment_versions = itertools.count(1)
+
+class Experiment:
+    # Time, pressure and temperature channels of one loaded log as contiguous
+    # float64 arrays. Derived series (time in sec/min/hr, divided pressure and
+    # temperature) are computed on first use and kept; changing a divisor
+    # drops only the series that depends on it.
+    __slots__ = ("time_sec", "pressure", "temperature", "divide_pressure_by", "divide_temp_by", "gas", "gas_volume", "complete", "version", "_derived")
+
+    def __init__(self, time_sec, pressure, temperature, divide_pressure_by=1.0, divide_temp_by=10.0, complete=True):
+        self.time_sec = np.ascontiguousarray(time_sec, dtype=np.float64)
+        self.pressure = np.ascontiguousarray(pressure, dtype=np.float64)
+        self.temperature = np.ascontiguousarray(temperature, dtype=np.float64)
+        self.divide_pressure_by = float(divide_pressure_by)
+        self.divide_temp_by = float(divide_temp_by)
+
+        # Gas and reactor volume (L) the moles and uptake series assume
+        self.gas = DEFAULT_SETTINGS['gas']
+        self.gas_volume = DEFAULT_SETTINGS['gas_volume']
+
+        # False when only the min/max envelope of a streamed log is held
+        self.complete = complete
+
+        # Unique per dataset, so views can tell a reload from the same data
+        self.version = next(_experiment_versions)
+        self._derived = {}
+
+    def __len__(self):
+        return len(self.time_sec)
+
+    def extend(self, time_sec, pressure, temperature):
+        # The same log with rows appended (live monitoring): the longer arrays
+        # replace the shorter ones and the derived series are dropped. The
+        # version stays, since rows are only ever added, (version, len) still
+        # names the data.
+        self.time_sec = np.ascontiguousarray(time_sec, dtype=np.float64)
+        self.pressure = np.ascontiguousarray(pressure, dtype=np.float64)
+        self.temperature = np.ascontiguousarray(temperature, dtype=np.float64)
+        self._derived.clear()
+
+    def set_divisors(self, divide_pressure_by, divide_temp_by):
+        if float(divide_pressure_by) != self.divide_pressure_by:
+            self.divide_pressure_by = float(divide_pressure_by)
+            self.forget('pressure')
+        if float(divide_temp_by) != self.divide_temp_by:
+            self.divide_temp_by = float(divide_temp_by)
+            self.forget('temperature')
+
+    def set_gas(self, gas, gas_volume):
+        if gas != self.gas or float(gas_volume) != self.gas_volume:
+            self.gas, self.gas_volume = gas, float(gas_volume)
+            self.forget(None)
+
+    def forget(self, var):
+        # Drop the divided series of a channel (resampled ones included), the
+        # gas quantities computed from them and the events
+        for key in list(self._derived):
+            name = key[1] if isinstance(key, tuple) and key[0] == 'resampled' else (key[0] if isinstance(key, tuple) else key)
+            if name in ('moles', 'uptake') or (name == var and key[0] != 'resampled'):
+                del self._derived[key]
+        if var is not None:
+            self._derived.pop('events', None)
+
+    def series(self, var, time_unit="sec", resample=None):
+        # resample: (bin seconds, statistic) as from resample_spec, or None
+        key = ('time', time_unit) if var == 'time' else var
+        if resample is not None:
+            key = (key if var == 'time' else (var,)) + tuple(resample)
+        if key in self._derived:
+            return self._derived[key]
+
+        if var == 'time':
+            if time_unit not in TIME_UNIT_SECONDS:
+                return None
+            values = self.time_sec if resample is None else self.resampled('time', *resample)
+            values = values if time_unit == 'sec' else values / TIME_UNIT_SECONDS[time_unit]
+        elif var == 'pressure':
+            values = (self.pressure if resample is None else self.resampled('pressure', *resample)) / self.divide_pressure_by
+        elif var == 'temperature':
+            values = (self.temperature if resample is None else self.resampled('temperature', *resample)) / self.divide_temp_by
+        elif var == 'moles' and resample is None:
+            with span("eos", rows=len(self)):
+                values = gas_moles(self.series('pressure'), self.series('temperature'), self.gas_volume, self.gas)
+        elif var == 'uptake' and resample is None:
+            values = gas_uptake(self.series('moles'))
+        elif var in ('moles', 'uptake'):
+            values = self.resampled(var, *resample)
+        else:
+            return None
+
+        self._derived[key] = values
+        return values
+
+    def resampled(self, var, rule, stat):
+        # Raw channel (or time) per (channel, bin, statistic), kept across
+        # divisor changes; the bins are shared by every channel
+        key = ('resampled', var, rule, stat)
+        if key not in self._derived:
+            with span("resample", rows=len(self)):
+                if ('bins', rule) not in self._derived and stat != 'rolling':
+                    self._derived[('bins', rule)] = time_bins(self.time_sec, rule)
+                source = self.time_sec if var == 'time' else getattr(self, var) if var in ('pressure', 'temperature') else self.series(var)
+                self._derived[key] = resample_series(self.time_sec, source, rule, stat, self._derived.get(('bins', rule)))[0 if var == 'time' else 1]
+        return self._derived[key]
+
+    def select(self, x_var, y_var, time_unit, resample=None):
+        with span("series", rows=len(self)):
+            return self.series(x_var, time_unit, resample), self.series(y_var, time_unit, resample)
+
+    def pyramid(self, var):
+        # Min/max pyramid of a raw channel over time, or None when the rows
+        # are not in time order (or var is not a channel)
+        if var not in ('pressure', 'temperature'):
+            return None
+        if not self.time_sorted() or not len(self):
+            return None
+        if ('pyramid', var) not in self._derived:
+            with span("pyramid", rows=len(self)):
+                self._derived[('pyramid', var)] = MinMaxPyramid.build(getattr(self, var))
+        return self._derived[('pyramid', var)]
+
+    def time_sorted(self):
+        if 'time_sorted' not in self._derived:
+            self._derived['time_sorted'] = bool(np.all(self.time_sec[1:] >= self.time_sec[:-1]))
+        return self._derived['time_sorted']
+
+    def set_pyramid(self, var, pyramid):
+        self._derived[('pyramid', var)] = pyramid
+
+    def events(self, resample=None):
+        # Detected on the divided series, so the thresholds are in display
+        # units; kept until a divisor changes. With resample, the row indices
+        # point into the resampled series instead.
+        if 'events' not in self._derived:
+            with span("events", rows=len(self)):
+                self._derived['events'] = detect_events(self.time_sec, self.series('pressure'), self.series('temperature'))
+        if resample is None:
+            return self._derived['events']
+        return reindex_events(self._derived['events'], self.time_sec, self.series('time', 'sec', resample))
+
+# Sensors a DWStemp log has room for
+CHANNEL_SENSORS = {'pressure': [1, 2], 'temperature': [1, 2, 3, 4]}
+
+class ChannelSet:
+    # Time and every pressure and temperature channel of one log, from a
+    # single parse, for the multi-channel layouts. Channels that are all zero
+    # (or empty) are treated as unused sensors and left out of the plots.
+    __slots__ = ("time_sec", "raw", "divide_pressure_by", "divide_temp_by", "version")
+
+    def __init__(self, time_sec, raw, divide_pressure_by=1.0, divide_temp_by=10.0):
+        self.time_sec = np.ascontiguousarray(time_sec, dtype=np.float64)
+        self.raw = raw
+        self.divide_pressure_by = float(divide_pressure_by)
+        self.divide_temp_by = float(divide_temp_by)
+        self.version = next(_experiment_versions)
+
+    def __len__(self):
+        return len(self.time_sec)
+
+    def active(self):
+        # (var, sensor_num) of the channels that logged anything, pressure first
+        return [key for key, values in self.raw.items() if len(values) and np.nanmax(np.abs(values), initial=0) > 0]
+
+    def series(self, var, sensor_num):
+        return self.raw[(var, sensor_num)] / (self.divide_pressure_by if var == 'pressure' else self.divide_temp_by)
+
+    def experiment(self, pressure_sensor_num, temperature_sensor_num):
+        # The selected pair as an Experiment sharing these arrays, for the single-channel views
+        return Experiment(self.time_sec, self.raw[('pressure', pressure_sensor_num)], self.raw[('temperature', temperature_sensor_num)], self.divide_pressure_by, self.divide_temp_by)
+
+class RunningStats:
+    # Count, mean, variance (Welford, merged a chunk at a time), min and max
+    # of one channel, without keeping its values
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if n == 0:
+            return
+
+        # Merge the chunk's own mean and M2 into the running ones
+        mean = float(values.mean())
+        m2 = float(np.square(values - mean).sum())
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    def scaled(self, divisor):
+        # Statistics of values / divisor
+        stats = RunningStats()
+        stats.count = self.count
+        stats.mean = self.mean / divisor
+        stats.m2 = self.m2 / (divisor * divisor)
+        stats.min, stats.max = sorted((self.min / divisor, self.max / divisor))
+        return stats
+
+# Logs bigger than this are streamed instead of loaded whole
+OUT_OF_CORE_BYTES = 2 * 2**30
+
+# Points kept from a streamed log for plotting (a few per pixel column at 350 DPI)
+STREAM_POINTS = 16384
+
+def stream_experiment(file_path, pressure_sensor_num, temperature_sensor_num, divide_pressure_by=1.0, divide_temp_by=10.0, max_points=STREAM_POINTS, block_bytes=TAIL_BLOCK_BYTES, progress=None, cancelled=None):
+    # One pass over a log of any size in bounded blocks. Returns an Experiment
+    # holding the min/max envelope of pressure and temperature (at most
+    # about max_points rows, all channels kept aligned) and RunningStats of
+    # the raw pressure and temperature over every row.
+    columns = [TIME_COLUMN, pressure_column(pressure_sensor_num), temperature_column(temperature_sensor_num)]
+    stats = {'pressure': RunningStats(), 'temperature': RunningStats()}
+    kept = []
+    kept_rows = 0
+    buckets = max(max_points // 4, 1)
+
+    for offset, file_size, rows in iter_row_blocks(file_path, columns, final=True, block_bytes=block_bytes):
+        if rows is not None and len(rows[0]):
+            time_sec, pressure, temperature = rows
+            stats['pressure'].update(pressure)
+            stats['temperature'].update(temperature)
+
+            index = envelope_index([pressure, temperature], buckets) if len(time_sec) > max_points else np.arange(len(time_sec))
+            if not kept:
+                # Keep the first rows as they are for the preview
+                index = np.union1d(index, np.arange(min(5, len(time_sec))))
+            kept.append(np.stack([time_sec[index], pressure[index], temperature[index]]))
+            kept_rows += len(index)
+
+            # Envelope of envelopes is still the envelope: shrink when it grows
+            if kept_rows > 2 * max_points:
+                merged = np.concatenate(kept, axis=1)
+                index = np.union1d(envelope_index([merged[1], merged[2]], buckets), np.arange(5))
+                kept = [merged[:, index]]
+                kept_rows = len(index)
+
+        if progress is not None:
+            progress(offset, file_size)
+        if cancelled is not None and cancelled():
+            raise LoadCancelled()
+
+    merged = np.concatenate(kept, axis=1) if kept else np.empty((3, 0))
+    experiment = Experiment(merged[0], merged[1], merged[2], divide_pressure_by, divide_temp_by, complete=False)
+    return experiment, stats
+
+def experiment_stats(experiment):
+    # RunningStats of the raw channels of an experiment held in memory
+    stats = {'pressure': RunningStats(), 'temperature': RunningStats()}
+    stats['pressure'].update(experiment.pressure)
+    stats['temperature'].update(experiment.temperature)
+    return stats
+
+def load_experiment(file_path, pressure_sensor_num, temperature_sensor_num, divide_pressure_by=1.0, divide_temp_by=10.0, progress=None, cancelled=None, time_range=None):
+    # Small logs are loaded whole (through the cache); huge ones are streamed.
+    # A time_range (start, end) in seconds reads just that window through the
+    # log's time index, whatever the size of the log.
+    columns = [TIME_COLUMN, pressure_column(pressure_sensor_num), temperature_column(temperature_sensor_num)]
+    if time_range is not None:
+        experiment = Experiment(*read_dwstemp_range(file_path, columns, *time_range), divide_pressure_by, divide_temp_by)
+        with span("stats", rows=len(experiment)):
+            stats = experiment_stats(experiment)
+        return experiment, stats
+
+    file_size = os.path.getsize(file_path)
+    if file_size > OUT_OF_CORE_BYTES:
+        with span("stream", bytes=file_size) as fields:
+            experiment, stats = stream_experiment(file_path, pressure_sensor_num, temperature_sensor_num, divide_pressure_by, divide_temp_by, progress=progress, cancelled=cancelled)
+            fields['rows'] = stats['pressure'].count
+        return experiment, stats
+
+    experiment = Experiment(*read_dwstemp_cached(file_path, columns, progress=progress, cancelled=cancelled), divide_pressure_by, divide_temp_by)
+    with span("stats", rows=len(experiment)):
+        stats = experiment_stats(experiment)
+    return experiment, stats
+
+def load_pyramids(file_path, experiment, pressure_sensor_num, temperature_sensor_num, persist=True):
+    # Build the pressure and temperature pyramids of a loaded log, or take
+    # them from the parsed-log cache, which keeps them next to the columns.
+    # persist=False (a time window, an archived experiment) builds them without the cache.
+    channels = {'pressure': pressure_column(pressure_sensor_num), 'temperature': temperature_column(temperature_sensor_num)}
+    names = {var: f"pyramid{column}" for var, column in channels.items()}
+
+    # A streamed log holds only its envelope, whose pyramid is not worth keeping
+    cache = get_log_cache() if experiment.complete and persist else None
+    stored = {}
+    if cache is not None:
         try:
-            rcParams['font.sans-serif'] = ['Arial']
-        except:
-            print("ERROR Note that Arial and SF Pro are not installed in the computer. The program will use the default font.")
+            key = cache.key(file_path)
+            stored = cache.load(key, list(names.values()))
+        except OSError:
+            cache = None
+
+    built = {}
+    for var, name in names.items():
+        if name in stored and len(stored[name]) == pyramid_offsets(len(experiment))[-1]:
+            experiment.set_pyramid(var, MinMaxPyramid(len(experiment), stored[name]))
+        elif experiment.pyramid(var) is not None:
+            built[name] = experiment.pyramid(var).pairs
+
+    if cache is not None and built:
+        try:
+            cache.store(key, built)
+        except OSError:
             pass
 
-    # Label should be far away from the axes
-    rcParams['axes.labelpad'] = 8
-    rcParams['xtick.major.pad'] = 7
-    rcParams['ytick.major.pad'] = 7
+def load_channels(file_path, divide_pressure_by=1.0, divide_temp_by=10.0, progress=None, cancelled=None, time_range=None):
+    # Every channel of a log in one parse (through the cache, or just a time window)
+    keys = [(var, sensor_num) for var, sensors in CHANNEL_SENSORS.items() for sensor_num in sensors]
+    columns = [TIME_COLUMN] + [pressure_column(n) if var == 'pressure' else temperature_column(n) for var, n in keys]
+    if time_range is not None:
+        arrays = read_dwstemp_range(file_path, columns, *time_range)
+    elif os.path.getsize(file_path) > OUT_OF_CORE_BYTES:
+        raise ValueError("the log is too large to hold every channel; load a time range of it instead")
+    else:
+        arrays = read_dwstemp_cached(file_path, columns, progress=progress, cancelled=cancelled)
+    return ChannelSet(arrays[0], dict(zip(keys, arrays[1:])), divide_pressure_by, divide_temp_by)
+
+# Parquet archive of many logs: one hive partition (experiment=<name>) per
+# log, every channel under its normalized header name ("Temp. 3" -> temp3)
+# and with the values as they are in the CSV, so the divisors still apply.
+# Row groups are small enough for their Time statistics to skip most of a
+# log when only a time window is asked for.
+ARCHIVE_FILE = "part-0.parquet"
+ARCHIVE_ROW_GROUP = 65536
+
+# Units row -> unit kept in the archive's field metadata
+ARCHIVE_UNITS = {'No.': '', 'sec': 's', 'kgf/㎠': 'kgf/cm2', '℃': 'degC'}
+
+def channel_name(name):
+    # Header name -> archive column: "RecNo." -> recno, "Temp. 3" -> temp3
+    return "".join(c for c in name.lower() if c.isalnum())
+
+def pressure_channel(sensor_num):
+    return f"pressure{sensor_num}"
+
+def temperature_channel(sensor_num):
+    return f"temp{sensor_num}"
+
+def require_pyarrow():
+    if importlib.util.find_spec("pyarrow") is None:
+        raise RuntimeError("the Parquet archive needs pyarrow (pip install pyarrow)")
+
+def archive_names(files):
+    # File name without extension; a name used twice gets a hash of its path
+    stems = [os.path.splitext(os.path.basename(file_path))[0] for file_path in files]
+    return [stem if stems.count(stem) == 1 else f"{stem}-{hashlib.blake2b(os.path.abspath(file_path).encode('utf-8'), digest_size=4).hexdigest()}" for stem, file_path in zip(stems, files)]
+
+def archive_partition(archive_dir, name):
+    return os.path.join(archive_dir, "experiment=" + urllib.parse.quote(name, safe=""))
+
+def convert_log(file_path, archive_dir, name):
+    # Write one log as the experiment's partition; returns False when the
+    # partition already holds this very file (same hash of its whole content;
+    # the sampled fingerprint would miss a same-size edit in the middle)
+    require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    part_path = os.path.join(archive_partition(archive_dir, name), ARCHIVE_FILE)
+    digest = content_hash(file_path)
+    try:
+        if (pq.read_schema(part_path).metadata or {}).get(b"content_hash") == digest.encode():
+            return False
+    except (OSError, ValueError):
+        pass
+
+    names, units = read_dwstemp_header(file_path)
+    columns = [column for column, header in enumerate(names) if header]
+    fields = [pa.field(channel_name(names[column]), pa.float64(), metadata={'unit': ARCHIVE_UNITS.get(units[column], units[column]) if column < len(units) else '', 'header': names[column]}) for column in columns]
+    table = pa.Table.from_arrays([pa.array(values) for values in read_dwstemp(file_path, columns)], schema=pa.schema(fields, metadata={'source': os.path.abspath(file_path), 'content_hash': digest}))
+
+    # Written aside and moved in, so a query never sees half a partition
+    os.makedirs(os.path.dirname(part_path), exist_ok=True)
+    tmp_path = part_path + f".{os.getpid()}.tmp"
+    pq.write_table(table, tmp_path, row_group_size=ARCHIVE_ROW_GROUP, compression="zstd")
+    os.replace(tmp_path, part_path)
+    return True
+
+def convert_logs(files, archive_dir, workers=None, progress=None):
+    # Convert every log across a process pool; returns (file, name, converted, error)
+    require_pyarrow()
+    os.makedirs(archive_dir, exist_ok=True)
+    names = archive_names(files)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(convert_log, file_path, archive_dir, name): (file_path, name) for file_path, name in zip(files, names)}
+        for done, future in enumerate(as_completed(futures), 1):
+            file_path, name = futures[future]
+            try:
+                results.append((file_path, name, future.result(), None))
+            except Exception as e:
+                results.append((file_path, name, False, e))
+            if progress is not None:
+                progress(done, len(files))
+
+    # Report in input order, not completion order
+    order = {file_path: i for i, file_path in enumerate(files)}
+    results.sort(key=lambda result: order[result[0]])
+    return results
+
+def archive_experiments(archive_dir):
+    # Names of the experiments in an archive, sorted
+    names = []
+    for entry in os.listdir(archive_dir):
+        if entry.startswith("experiment=") and os.path.isfile(os.path.join(archive_dir, entry, ARCHIVE_FILE)):
+            names.append(urllib.parse.unquote(entry.split("=", 1)[1]))
+    return sorted(names)
+
+def query_archive(archive_dir, channels, experiments=None, time_range=None, workers=None):
+    # {experiment: {channel: array}} holding only the asked channels (and
+    # time) of the asked experiments, and only rows with start <= time <= end
+    # (seconds) when a time_range is given. Partitions not asked for are
+    # never opened and row groups outside the time range are never read.
+    require_pyarrow()
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(archive_dir, format="parquet", partitioning="hive")
+    rows = None
+    if time_range is not None:
+        rows = (ds.field("time") >= time_range[0]) & (ds.field("time") <= time_range[1])
+    partitions = None if experiments is None else ds.field("experiment").isin(list(experiments))
+    columns = list(dict.fromkeys(["time", *channels]))
+
+    def read(fragment):
+        name = ds.get_partition_keys(fragment.partition_expression)['experiment']
+        table = fragment.to_table(schema=dataset.schema, columns=columns, filter=rows)
+        return name, {column: table.column(column).to_numpy() for column in columns}
+
+    # Fragments are read concurrently; Arrow releases the GIL while decoding
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(executor.map(read, dataset.get_fragments(filter=partitions)))
+
+def load_archived_experiment(archive_dir, name, pressure_sensor_num, temperature_sensor_num, divide_pressure_by=1.0, divide_temp_by=10.0, time_range=None):
+    # load_experiment for an experiment kept in a Parquet archive
+    pressure, temperature = pressure_channel(pressure_sensor_num), temperature_channel(temperature_sensor_num)
+    with span("archive") as fields:
+        found = query_archive(archive_dir, [pressure, temperature], [name], time_range)
+        if name not in found:
+            raise ValueError(f"not in the archive: {name}")
+        fields['rows'] = len(found[name]['time'])
+
+    experiment = Experiment(found[name]['time'], found[name][pressure], found[name][temperature], divide_pressure_by, divide_temp_by)
+    with span("stats", rows=len(experiment)):
+        stats = experiment_stats(experiment)
+    return experiment, stats
+
+def load_archived_channels(archive_dir, name, divide_pressure_by=1.0, divide_temp_by=10.0, time_range=None):
+    # load_channels for an experiment kept in a Parquet archive
+    keys = [(var, sensor_num) for var, sensors in CHANNEL_SENSORS.items() for sensor_num in sensors]
+    names = [pressure_channel(n) if var == 'pressure' else temperature_channel(n) for var, n in keys]
+    with span("archive") as fields:
+        found = query_archive(archive_dir, names, [name], time_range)
+        if name not in found:
+            raise ValueError(f"not in the archive: {name}")
+        fields['rows'] = len(found[name]['time'])
+    return ChannelSet(found[name]['time'], {key: found[name][channel] for key, channel in zip(keys, names)}, divide_pressure_by, divide_temp_by)
+
+# Cross-experiment summary index: one row of statistics per log in a
+# SQLite file, keyed by a hash of the log's whole content. Values are kept as they are
+# in the CSV (before the divisors), like the archive.
+SUMMARY_INDEX = ".dwspapyrus-summary.sqlite"
+SUMMARY_INDEX_VERSION = 2
+SUMMARY_STATS = ("min", "max", "mean", "std")
+
+def summary_channels():
+    # (var, sensor number, column name) of every channel
+    return [(var, n, pressure_channel(n) if var == 'pressure' else temperature_channel(n)) for var, sensors in CHANNEL_SENSORS.items() for n in sensors]
+
+def summary_fields():
+    # Columns of a summary after the content hash
+    fields = ["rows", "start_s", "end_s", "duration_s"]
+    for var, _, name in summary_channels():
+        fields.extend(f"{name}_{stat}" for stat in SUMMARY_STATS)
+        if var == 'pressure':
+            fields.append(f"{name}_max_time_s")
+    return fields
+
+def finite_or_none(value):
+    return float(value) if value is not None and np.isfinite(value) else None
+
+def summarize_log(file_path, block_bytes=TAIL_BLOCK_BYTES):
+    # One pass over a log in bounded blocks: RunningStats of the time and
+    # every channel, and the time of each pressure channel's maximum.
+    # Returns {field: value}, None where a channel has no values.
+    channels = summary_channels()
+    columns = [TIME_COLUMN] + [pressure_column(n) if var == 'pressure' else temperature_column(n) for var, n, _ in channels]
+    time_stats = RunningStats()
+    stats = [RunningStats() for _ in channels]
+    max_time = {}
+    rows = 0
+
+    for _, _, block in iter_row_blocks(file_path, columns, final=True, block_bytes=block_bytes):
+        if block is None or len(block[0]) == 0:
+            continue
+        time_sec = block[0]
+        rows += len(time_sec)
+        time_stats.update(time_sec)
+        for (var, _, name), channel_stats, values in zip(channels, stats, block[1:]):
+            previous = channel_stats.max
+            channel_stats.update(values)
+            if var == 'pressure' and channel_stats.max > previous:
+                max_time[name] = time_sec[np.nanargmax(values)]
+
+    summary = {
+        'rows': rows,
+        'start_s': finite_or_none(time_stats.min),
+        'end_s': finite_or_none(time_stats.max),
+        'duration_s': finite_or_none(time_stats.max - time_stats.min),
+    }
+    for (var, _, name), channel_stats in zip(channels, stats):
+        values = (channel_stats.min, channel_stats.max, channel_stats.mean, channel_stats.std) if channel_stats.count else (None,) * len(SUMMARY_STATS)
+        summary.update({f"{name}_{stat}": finite_or_none(value) for stat, value in zip(SUMMARY_STATS, values)})
+        if var == 'pressure':
+            summary[f"{name}_max_time_s"] = finite_or_none(max_time.get(name))
+    return summary
+
+def scaled_summary(summary, divide_pressure_by=1.0, divide_temp_by=10.0):
+    # A summary in display units: channel values divided like the plotted series
+    scaled = dict(summary)
+    for var, _, name in summary_channels():
+        divisor = divide_pressure_by if var == 'pressure' else divide_temp_by
+        for stat in SUMMARY_STATS:
+            value = summary[f"{name}_{stat}"]
+            # Standard deviations stay positive
+            scaled[f"{name}_{stat}"] = None if value is None else value / (abs(divisor) if stat == "std" else divisor)
+        if divisor < 0:
+            scaled[f"{name}_min"], scaled[f"{name}_max"] = scaled[f"{name}_max"], scaled[f"{name}_min"]
+    return scaled
+
+def summary_index_path(folder):
+    # In the folder itself, or in the cache directory when the folder is read-only (a shared drive)
+    if os.access(folder, os.W_OK):
+        return os.path.join(folder, SUMMARY_INDEX)
+    name = hashlib.blake2b(os.path.abspath(folder).encode("utf-8"), digest_size=16).hexdigest()
+    os.makedirs(default_cache_dir(), exist_ok=True)
+    return os.path.join(default_cache_dir(), f"summary-{name}.sqlite")
+
+class SummaryIndex:
+    # SQLite index of summarize_log results. summaries holds one row per
+    # content_hash; files maps each path to the hash it had at its size and
+    # mtime, so an unchanged log is not even opened, and a changed one is
+    # hashed whole (a same-size edit in the middle counts) before a copied
+    # or renamed log reuses its summary. The connection belongs to the
+    # thread that opened the index.
+    def __init__(self, path):
+        import sqlite3
+
+        self.path = path
+        self.db = sqlite3.connect(path)
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != SUMMARY_INDEX_VERSION:
+            # Older layout: summaries are cheap to rebuild
+            with self.db:
+                self.db.execute("DROP TABLE IF EXISTS summaries")
+                self.db.execute("DROP TABLE IF EXISTS files")
+                fields = ", ".join(f"{field} {'INTEGER' if field == 'rows' else 'REAL'}" for field in summary_fields())
+                self.db.execute(f"CREATE TABLE summaries (hash TEXT PRIMARY KEY, {fields})")
+                self.db.execute("CREATE TABLE files (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, hash TEXT)")
+                self.db.execute(f"PRAGMA user_version = {SUMMARY_INDEX_VERSION}")
+
+    def close(self):
+        self.db.close()
+
+    def update(self, files, workers=None, progress=None, cancelled=None):
+        # Hash new or changed logs, then summarize each distinct content once,
+        # both across a process pool. A log whose content is already indexed
+        # (including a second copy in this run) counts as reused.
+        # Returns (summarized, reused, [(file, error)])
+        known = {path: (size, mtime_ns, digest) for path, size, mtime_ns, digest in self.db.execute("SELECT path, size, mtime_ns, hash FROM files")}
+        have = {digest for (digest,) in self.db.execute("SELECT hash FROM summaries")}
+
+        reused = 0
+        errors = []
+        changed = {}
+        for file_path in map(os.path.abspath, files):
+            if file_path in changed:
+                # The same log listed twice
+                reused += 1
+                continue
+            try:
+                stat = os.stat(file_path)
+            except OSError as e:
+                errors.append((file_path, e))
+                continue
+            entry = known.get(file_path)
+            if entry is None or entry[:2] != (stat.st_size, stat.st_mtime_ns) or entry[2] not in have:
+                changed[file_path] = stat
+        if not changed:
+            self.prune(known)
+            return 0, reused, errors
+
+        fields = summary_fields()
+        summarized = 0
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            todo = {}
+            hashes = {executor.submit(content_hash, file_path): file_path for file_path in changed}
+            for future in as_completed(hashes):
+                file_path = hashes[future]
+                try:
+                    digest = future.result()
+                except OSError as e:
+                    errors.append((file_path, e))
+                    continue
+                if digest in have:
+                    reused += 1
+                    with self.db:
+                        self.db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", (file_path, changed[file_path].st_size, changed[file_path].st_mtime_ns, digest))
+                elif digest in todo:
+                    # Another copy of a log summarized in this run
+                    reused += 1
+                    todo[digest].append(file_path)
+                else:
+                    todo[digest] = [file_path]
+                if cancelled is not None and cancelled():
+                    raise LoadCancelled()
+
+            futures = {executor.submit(summarize_log, paths[0]): digest for digest, paths in todo.items()}
+            for done, future in enumerate(as_completed(futures), 1):
+                digest = futures[future]
+                try:
+                    summary = future.result()
+                except Exception as e:
+                    errors.extend((file_path, e) for file_path in todo[digest])
+                    continue
+                # Stored as each log finishes, so a cancelled run keeps what it did
+                with self.db:
+                    self.db.execute(f"INSERT OR REPLACE INTO summaries VALUES (?, {', '.join('?' * len(fields))})", [digest] + [summary[field] for field in fields])
+                    self.db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", [(file_path, changed[file_path].st_size, changed[file_path].st_mtime_ns, digest) for file_path in todo[digest]])
+                summarized += 1
+                if progress is not None:
+                    progress(done, len(futures))
+                if cancelled is not None and cancelled():
+                    raise LoadCancelled()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        self.prune(known)
+        return summarized, reused, errors
+
+    def prune(self, known):
+        # Forget logs that are gone, and summaries no file points at any more
+        with self.db:
+            self.db.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in known if not os.path.exists(path)])
+            self.db.execute("DELETE FROM summaries WHERE hash NOT IN (SELECT hash FROM files)")
+
+    def rows(self, files=None):
+        # Summaries as dicts with their 'path', by path; only those of files if given
+        wanted = None if files is None else set(map(os.path.abspath, files))
+        fields = summary_fields()
+        cursor = self.db.execute(f"SELECT files.path, {', '.join('summaries.' + field for field in fields)} FROM files JOIN summaries USING (hash) ORDER BY files.path")
+        return [dict(zip(['path'] + fields, row)) for row in cursor if wanted is None or row[0] in wanted]
+
+def index_logs(files, index_path, workers=None, progress=None, cancelled=None):
+    # Bring the index up to date for files; returns (their summaries, summarized, reused, errors)
+    index = SummaryIndex(index_path)
+    try:
+        summarized, reused, errors = index.update(files, workers, progress, cancelled)
+        return index.rows(files), summarized, reused, errors
+    finally:
+        index.close()
+
+def select_series(time_sec, pressure, temperature, x_var, y_var, time_unit, divide_pressure_by, divide_temp_by, gas='CH4', gas_volume=1.0):
+    # One-off selection, for callers that do not keep an Experiment around
+    experiment = Experiment(time_sec, pressure, temperature, divide_pressure_by, divide_temp_by)
+    experiment.set_gas(gas, gas_volume)
+    return experiment.select(x_var, y_var, time_unit)
+
+def follow_series(time_sec, pressure, temperature, settings, moles_ref=None):
+    # select_series for a block of followed rows. Uptake is measured from the
+    # log's first finite moles reading, moles_ref (None until one is seen), so
+    # a later block needs none of the rows before it. Returns x, y and the
+    # reference for the next block.
+    experiment = Experiment(time_sec, pressure, temperature, settings['divide_pressure_by'], settings['divide_temp_by'])
+    experiment.set_gas(settings['gas'], settings['gas_volume'])
+    if 'uptake' not in (settings['x_var'], settings['y_var']):
+        return (*experiment.select(settings['x_var'], settings['y_var'], settings['time_unit']), moles_ref)
+
+    moles = experiment.series('moles')
+    if moles_ref is None:
+        finite = np.flatnonzero(np.isfinite(moles))
+        moles_ref = moles[finite[0]] if len(finite) else None
+    uptake = moles_ref - moles if moles_ref is not None else np.full(len(moles), np.nan)
+    pick = lambda var: uptake if var == 'uptake' else experiment.series(var, settings['time_unit'])
+    return pick(settings['x_var']), pick(settings['y_var']), moles_ref
+
+# Event detection thresholds, in display units (divided pressure, ℃) per hour
+EVENT_THRESHOLDS = {
+    'window_sec': 600,            # slope between the means of this much data before and after each sample
+    'drop_rate': 1.0,             # a pressure drop starts below -drop_rate ...
+    'drop_release': 0.5,          # ... and lasts until the slope is above -drop_release
+    'min_drop': 0.5,              # total pressure change of a reported drop
+    'ramp_rate': 0.5,             # the same hysteresis for temperature ramps
+    'ramp_release': 0.25,
+    'min_ramp': 1.0,              # total temperature change of a reported ramp
+    'spike_sec': 1800,            # rises shorter than this are spikes (e.g. a formation exotherm)
+    'steady_pressure_rate': 0.1,  # both channels flatter than these (twice as much to leave) ...
+    'steady_temp_rate': 0.3,
+    'min_steady_sec': 3600,       # ... for at least this long
+}
+
+# Names in the GUI panel, and legend labels on the (English) plot
+EVENT_NAMES = {
+    'pressure_drop': '압력 강하',
+    'temperature_spike': '온도 급등',
+    'temperature_rise': '승온',
+    'temperature_fall': '냉각',
+    'steady': '정상 상태',
+}
+EVENT_LABELS = {
+    'pressure_drop': 'Pressure drop',
+    'temperature_spike': 'Temperature spike',
+    'temperature_rise': 'Heating',
+    'temperature_fall': 'Cooling',
+    'steady': 'Steady state',
+}
+
+# Events listed in the GUI panel; the plot shows all of them
+MAX_LISTED_EVENTS = 200
+
+EVENT_COLORS = {
+    'pressure_drop': 'tab:red',
+    'temperature_spike': 'tab:purple',
+    'temperature_rise': 'tab:orange',
+    'temperature_fall': 'tab:blue',
+    'steady': 'tab:green',
+}
+
+def window_slope(t_hours, values, window):
+    # Per-hour slope between the means of the `window` samples up to and
+    # after each sample, from running sums (offset first to keep precision).
+    # The first and last samples, without a full window on one side, take
+    # the nearest full-window slope.
+    window = max(min(window, (len(values) - 1) // 2), 1)
+    sum_t = np.concatenate(([0.0], np.cumsum(t_hours - t_hours[0])))
+    sum_v = np.concatenate(([0.0], np.cumsum(values - values[0])))
+
+    # Means of every run of `window` samples; sample i sits between runs i - window + 1 and i + 1
+    mean_t = sum_t[window:] - sum_t[:-window]
+    mean_v = sum_v[window:] - sum_v[:-window]
+    dt = mean_t[window:] - mean_t[:-window]
+    dv = mean_v[window:] - mean_v[:-window]
+    slope = np.divide(dv, dt, out=np.zeros(len(dv)), where=dt > 0)
+    return np.pad(slope, (window - 1, window), mode="edge")
+
+def hysteresis(enter, stay):
+    # On from wherever `enter` holds until `stay` stops holding: a two-state
+    # machine as array operations. Every sample that decides the state
+    # (enter, or not stay) passes its index forward with a running maximum.
+    decisive = enter | ~stay
+    last = np.maximum.accumulate(np.where(decisive, np.arange(len(enter)), -1))
+    return (last >= 0) & enter[np.maximum(last, 0)]
+
+def runs(mask):
+    # First and last index of every run of True
+    edges = np.diff(mask.astype(np.int8), prepend=0, append=0)
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+
+def detect_events(time_sec, pressure, temperature, thresholds=EVENT_THRESHOLDS):
+    # Pressure drops, temperature rises/spikes/falls and steady states as
+    # dicts of kind, first/last row index and the change of the channel
+    # they are about, sorted by start. One O(n) pass of array operations.
+    if len(time_sec) < 3:
+        return []
+
+    t_hours = time_sec / 3600
+    step = sample_step(time_sec) or 1.0
+    window = max(int(round(thresholds['window_sec'] / step)), 1)
+    p_slope = window_slope(t_hours, pressure, window)
+    t_slope = window_slope(t_hours, temperature, window)
+
+    candidates = []
+
+    drop = hysteresis(p_slope < -thresholds['drop_rate'], p_slope < -thresholds['drop_release'])
+    candidates.append(('pressure_drop', *runs(drop), pressure, thresholds['min_drop'], 0))
+
+    rise = hysteresis(t_slope > thresholds['ramp_rate'], t_slope > thresholds['ramp_release'])
+    starts, ends = runs(rise)
+    spike = time_sec[ends] - time_sec[starts] <= thresholds['spike_sec']
+    candidates.append(('temperature_spike', starts[spike], ends[spike], temperature, thresholds['min_ramp'], 0))
+    candidates.append(('temperature_rise', starts[~spike], ends[~spike], temperature, thresholds['min_ramp'], 0))
+
+    fall = hysteresis(t_slope < -thresholds['ramp_rate'], t_slope < -thresholds['ramp_release'])
+    candidates.append(('temperature_fall', *runs(fall), temperature, thresholds['min_ramp'], 0))
+
+    flat_p, flat_t = np.abs(p_slope), np.abs(t_slope)
+    steady = hysteresis(
+        (flat_p < thresholds['steady_pressure_rate']) & (flat_t < thresholds['steady_temp_rate']),
+        (flat_p < 2 * thresholds['steady_pressure_rate']) & (flat_t < 2 * thresholds['steady_temp_rate']))
+    candidates.append(('steady', *runs(steady), temperature, 0, thresholds['min_steady_sec']))
+
+    events = []
+    for kind, starts, ends, values, min_change, min_sec in candidates:
+        change = values[ends] - values[starts]
+        keep = (np.abs(change) >= min_change) & (time_sec[ends] - time_sec[starts] >= min_sec)
+        events.extend({'kind': kind, 'start': int(start), 'end': int(end), 'change': float(delta)} for start, end, delta in zip(starts[keep], ends[keep], change[keep]))
+    events.sort(key=lambda event: event['start'])
+    return events
+
+def reindex_events(events, time_sec, new_time_sec):
+    # The same events with start/end moved to the nearest rows of another
+    # (sorted) time axis, e.g. a resampled one
+    if not events or not len(new_time_sec):
+        return []
+    index = {}
+    for field in ('start', 'end'):
+        rows = np.array([event[field] for event in events], dtype=np.intp)
+        index[field] = np.clip(np.searchsorted(new_time_sec, time_sec[rows]), 0, len(new_time_sec) - 1)
+    return [dict(event, start=int(start), end=int(end)) for event, start, end in zip(events, index['start'], index['end'])]
+
+def parse_scale(text):
+    # "min, max" -> (min, max); empty -> None
+    if text is None or str(text).strip() == "":
+        return None
+    if isinstance(text, (tuple, list)):
+        return float(text[0]), float(text[1])
+    values = str(text).split(",")
+    return float(values[0]), float(values[1])
+
+def axis_labels(settings):
+    x_label = settings.get('x_label')
+    y_label = settings.get('y_label')
+    if x_label is None:
+        if settings['x_var'] == 'time':
+            x_label = TIME_UNIT_LABELS.get(settings['time_unit'], '')
+        else:
+            x_label = VARIABLE_LABELS.get(settings['x_var'], '')
+    if y_label is None:
+        y_label = VARIABLE_LABELS.get(settings['y_var'], '')
+    return x_label, y_label
+
+def point_budget(fig, dpi):
+    # Two points (the min and the max) per pixel column of the saved figure
+    return int(fig.get_figwidth() * dpi) * 2
+
+def envelope_index(channels, n_buckets):
+    # Indices of the lowest and highest value of every channel in each of
+    # n_buckets equal-count buckets, plus the first and last row, in order
+    n = len(channels[0])
+    size = -(-n // n_buckets)
+    n_full = n // size
+    starts = np.arange(n_full) * size
+    picks = [np.array([0, n - 1])]
+    for values in channels:
+        body = values[:n_full * size].reshape(n_full, size)
+        low, high = body, body
+        if np.isnan(body).any():
+            low = np.where(np.isnan(body), np.inf, body)
+            high = np.where(np.isnan(body), -np.inf, body)
+        picks += [starts + np.argmin(low, axis=1), starts + np.argmax(high, axis=1)]
+
+        # Last, shorter bucket
+        rest = values[n_full * size:]
+        if len(rest) and not np.isnan(rest).all():
+            picks.append(np.array([n_full * size + np.nanargmin(rest), n_full * size + np.nanargmax(rest)]))
+    return np.unique(np.concatenate(picks).astype(np.int64))
+
+def minmax_decimate(data_x, data_y, n_buckets):
+    # Keep the lowest and highest point of each equal-count bucket, in order.
+    # A line through them looks the same as the full series at one bucket per pixel.
+    if n_buckets <= 0 or len(data_y) <= 2 * n_buckets:
+        return data_x, data_y
+    index = envelope_index([data_y], n_buckets)
+    return data_x[index], data_y[index]
+
+def lttb_decimate(data_x, data_y, n_out):
+    # Largest-Triangle-Three-Buckets: from each bucket keep the point that
+    # forms the largest triangle with the previous pick and the next bucket's mean
+    n = len(data_y)
+    if n_out < 3 or n <= n_out:
+        return data_x, data_y
+
+    x = np.asarray(data_x, dtype=float)
+    y = np.asarray(data_y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[:n - 1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[:n - 1], edges[:-1]) / counts
+
+    index = np.empty(n_out, dtype=np.int64)
+    index[0], index[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 1 < n_out - 2:
+            cx, cy = mean_x[i + 1], mean_y[i + 1]
+        else:
+            cx, cy = x[-1], y[-1]
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        index[i + 1] = a
+    return data_x[index], data_y[index]
+
+# Finest pyramid level: buckets of 2**PYRAMID_BASE_LEVEL samples (finer views use the raw slice)
+PYRAMID_BASE_LEVEL = 3
+
+def pyramid_offsets(n):
+    # Where each level starts in the stacked (buckets, 2) array
+    offsets = [0]
+    level = PYRAMID_BASE_LEVEL
+    while True:
+        buckets = -(-n // 2**level)
+        offsets.append(offsets[-1] + buckets)
+        if buckets <= 1:
+            return offsets
+        level += 1
+
+class MinMaxPyramid:
+    # Index of the lowest and highest sample in every bucket of 2**k samples,
+    # for every k from PYRAMID_BASE_LEVEL until one bucket holds the whole
+    # series. The levels are stacked in one (buckets, 2) array so they can be
+    # saved as a single .npy. Indices, not values, so one pyramid serves the
+    # channel under any divisor and the x axis in any time unit.
+    __slots__ = ("n", "pairs", "offsets")
+
+    def __init__(self, n, pairs):
+        self.n = n
+        self.pairs = pairs
+        self.offsets = pyramid_offsets(n)
+
+    @classmethod
+    def build(cls, values):
+        n = len(values)
+        low = high = values
+        if np.isnan(values).any():
+            low = np.where(np.isnan(values), np.inf, values)
+            high = np.where(np.isnan(values), -np.inf, values)
+        dtype = np.int32 if n < 2**31 else np.int64
+
+        # Finest level straight from the samples, the last bucket possibly shorter
+        size = 2**PYRAMID_BASE_LEVEL
+        n_full = n // size
+        starts = np.arange(n_full, dtype=dtype) * size
+        level = np.column_stack([starts + np.argmin(low[:n_full * size].reshape(n_full, size), axis=1), starts + np.argmax(high[:n_full * size].reshape(n_full, size), axis=1)]).astype(dtype)
+        if n > n_full * size:
+            rest = n_full * size
+            level = np.vstack([level, [[rest + np.argmin(low[rest:]), rest + np.argmax(high[rest:])]]]).astype(dtype)
+
+        # Every coarser level compares the picks of two buckets of the one below
+        levels = [level]
+        while len(level) > 1:
+            if len(level) % 2:
+                level = np.vstack([level, level[-1:]])
+            a, b = level[0::2], level[1::2]
+            level = np.column_stack([np.where(low[a[:, 0]] <= low[b[:, 0]], a[:, 0], b[:, 0]), np.where(high[a[:, 1]] >= high[b[:, 1]], a[:, 1], b[:, 1])])
+            levels.append(level)
+        return cls(n, np.concatenate(levels))
+
+    def query(self, start, stop, budget):
+        # Sorted indices drawing rows start..stop within about `budget`
+        # points: the raw rows when they fit, else the min and max of each
+        # bucket of the coarsest level that still fits. One neighbour on each
+        # side keeps the line running to the edges of the view.
+        count = stop - start
+        if count <= budget:
+            return np.arange(max(start - 1, 0), min(stop + 1, self.n))
+
+        level = max(PYRAMID_BASE_LEVEL, int(np.ceil(np.log2(2 * count / budget))))
+        level = min(level, PYRAMID_BASE_LEVEL + len(self.offsets) - 2)
+        offset, end = self.offsets[level - PYRAMID_BASE_LEVEL], self.offsets[level - PYRAMID_BASE_LEVEL + 1]
+        first = max((start >> level) - 1, 0)
+        last = min(((stop - 1) >> level) + 2, end - offset)
+        return np.sort(self.pairs[offset + first:offset + last], axis=1).ravel()
+
+def decimate_series(data_x, data_y, mode, budget):
+    with span("decimate", rows=len(data_x)):
+        if mode == "minmax":
+            return minmax_decimate(data_x, data_y, budget // 2)
+        if mode == "lttb":
+            return lttb_decimate(data_x, data_y, budget)
+        return data_x, data_y
+
+def set_series_data(artist, data_x, data_y):
+    # Swap the data of a line or scatter artist made by plot_series
+    if hasattr(artist, "set_data"):
+        artist.set_data(data_x, data_y)
+    else:
+        artist.set_offsets(np.column_stack([data_x, data_y]))
+
+def draw_series(ax, data_x, data_y, settings):
+    # Never draw more points than the saved figure has pixels for
+    data_x, data_y = decimate_series(data_x, data_y, settings.get('decimation'), point_budget(ax.figure, settings['dpi']))
+
+    if settings['plot_style'] == "line":
+        artist, = ax.plot(data_x, data_y, color="black", linewidth=settings['line_width'])
+        return artist
+    elif settings['plot_style'] == "scatter":
+        return ax.scatter(data_x, data_y, color="black", s = settings['line_width'] * 2)
+    return None
+
+def style_series(artist, settings):
+    if settings['plot_style'] == "line":
+        artist.set_linewidth(settings['line_width'])
+    elif settings['plot_style'] == "scatter":
+        artist.set_sizes([settings['line_width'] * 2])
+
+def apply_axes_settings(ax, settings):
+    x_label, y_label = axis_labels(settings)
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+
+    # Adjust the x and y scale, or go back to autoscaling when cleared
+    x_scale = parse_scale(settings.get('x_scale'))
+    y_scale = parse_scale(settings.get('y_scale'))
+    if x_scale is not None:
+        ax.set_xlim(*x_scale)
+    else:
+        ax.autoscale(True, axis="x")
+    if y_scale is not None:
+        ax.set_ylim(*y_scale)
+    else:
+        ax.autoscale(True, axis="y")
+
+def plot_series(ax, data_x, data_y, settings):
+    artist = draw_series(ax, data_x, data_y, settings)
+    apply_axes_settings(ax, settings)
+    return artist
+
+def draw_events(ax, events, data_x, data_y, settings):
+    # One collection per event kind, so thousands of events stay cheap to
+    # draw: shaded spans on a time axis, onset markers on the curve otherwise.
+    # Returns the artists (legend included) so a view can remove them again.
+    from matplotlib.collections import PolyCollection
+
+    artists = []
+    for kind, label in EVENT_LABELS.items():
+        starts = np.array([event['start'] for event in events if event['kind'] == kind], dtype=np.intp)
+        if not len(starts):
+            continue
+        if settings['x_var'] == 'time':
+            ends = np.array([event['end'] for event in events if event['kind'] == kind], dtype=np.intp)
+            x0, x1 = data_x[starts], data_x[ends]
+            verts = np.stack([np.column_stack([x0, np.zeros(len(x0))]), np.column_stack([x0, np.ones(len(x0))]), np.column_stack([x1, np.ones(len(x0))]), np.column_stack([x1, np.zeros(len(x0))])], axis=1)
+            artist = PolyCollection(verts, transform=ax.get_xaxis_transform(), facecolor=EVENT_COLORS[kind], edgecolor="none", alpha=0.15, label=label)
+            ax.add_collection(artist, autolim=False)
+        else:
+            artist = ax.scatter(data_x[starts], data_y[starts], marker="v", color=EVENT_COLORS[kind], s=30, zorder=3, label=label)
+        artists.append(artist)
+    if artists:
+        artists.append(ax.legend(handles=artists, loc="best", fontsize="small"))
+    return artists
+
+class WorkerSignals(QObject):
+    progress = pyqtSignal(object, object)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+class Worker(QRunnable):
+    # Runs func(progress, cancelled) on the Qt thread pool. Results, errors
+    # and progress come back as signals, which Qt delivers on the GUI thread.
+    def __init__(self, func):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.func = func
+        self.signals = WorkerSignals()
+        self.cancel_requested = False
+
+    def cancel(self):
+        self.cancel_requested = True
+
+    def run(self):
+        try:
+            result = self.func(self.signals.progress.emit, lambda: self.cancel_requested)
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+# Decimals shown for the time column in each unit
+TIME_UNIT_DECIMALS = {'sec': 0, 'min': 2, 'hr': 4}
+
+class ExperimentTableModel(QAbstractTableModel):
+    # Every row of a loaded Experiment for a QTableView, straight from its
+    # arrays: a cell is formatted only when the view asks for it (the visible
+    # rows), so millions of rows cost no strings and no copies. Values are
+    # divided on the fly with the experiment's current divisors.
+    COLUMNS = ['time', 'pressure', 'temperature']
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.experiment = None
+        self.rows = 0
+        self.time_unit = 'sec'
+
+    def set_experiment(self, experiment, append=False):
+        # With append=True the experiment is the shown one (or the same one
+        # extended) plus rows read after it (live monitoring); those are
+        # inserted, so the view keeps its place. Anything else is a new dataset.
+        if append and self.experiment is not None and experiment is not None and len(experiment) > self.rows:
+            self.beginInsertRows(QModelIndex(), self.rows, len(experiment) - 1)
+            self.experiment = experiment
+            self.rows = len(experiment)
+            self.endInsertRows()
+            return
+        self.beginResetModel()
+        self.experiment = experiment
+        self.rows = 0 if experiment is None else len(experiment)
+        self.endResetModel()
+
+    def set_time_unit(self, time_unit):
+        self.time_unit = time_unit
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, 0)
+        self.refresh()
+
+    def refresh(self):
+        # After a divisor or unit change; the view re-asks only for what it shows
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or self.experiment is None:
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        row, column = index.row(), self.COLUMNS[index.column()]
+        if column == 'time':
+            return f"{self.experiment.time_sec[row] / TIME_UNIT_SECONDS[self.time_unit]:.{TIME_UNIT_DECIMALS[self.time_unit]}f}"
+        if column == 'pressure':
+            return f"{self.experiment.pressure[row] / self.experiment.divide_pressure_by:.2f}"
+        return f"{self.experiment.temperature[row] / self.experiment.divide_temp_by:.2f}"
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Vertical:
+            return str(section + 1)
+        column = self.COLUMNS[section]
+        return TIME_UNIT_LABELS[self.time_unit] if column == 'time' else VARIABLE_LABELS[column]
+
+    def row_at_time(self, time_sec):
+        # First row at or after time_sec: binary search while the log is in
+        # time order, the nearest row otherwise
+        times = self.experiment.time_sec
+        if self.experiment.time_sorted():
+            return min(int(np.searchsorted(times, time_sec)), len(times) - 1)
+        return int(np.nanargmin(np.abs(times - time_sec)))
+
+class SummaryTableModel(QAbstractTableModel):
+    # One row per indexed log (index_logs), in display units: channel values
+    # divided like the plots and times in the selected unit. Channels that
+    # are zero in every log are left out. UserRole gives the raw number, so
+    # a QSortFilterProxyModel sorts numerically.
+    def __init__(self, summaries, divide_pressure_by=1.0, divide_temp_by=10.0, time_unit='hr', parent=None):
+        super().__init__(parent)
+        self.summaries = [scaled_summary(summary, divide_pressure_by, divide_temp_by) for summary in summaries]
+        self.time_unit = time_unit
+
+        self.columns = [('file', "File"), ('rows', "Rows"), ('duration_s', f"Duration ({time_unit})")]
+        for var, n, name in summary_channels():
+            if not any(summary[f"{name}_min"] or summary[f"{name}_max"] for summary in self.summaries):
+                continue
+            label = f"{VARIABLE_LABELS[var]}{n}"
+            self.columns.extend((f"{name}_{stat}", f"{label} {stat}") for stat in SUMMARY_STATS)
+            if var == 'pressure':
+                self.columns.append((f"{name}_max_time_s", f"{label} max at ({time_unit})"))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.summaries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def value(self, row, field):
+        summary = self.summaries[row]
+        if field == 'file':
+            return os.path.basename(summary['path'])
+        value = summary[field]
+        if value is not None and field.endswith("_s"):
+            value /= TIME_UNIT_SECONDS[self.time_unit]
+        return value
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        field = self.columns[index.column()][0]
+        if role == Qt.ItemDataRole.UserRole:
+            return self.value(index.row(), field)
+        if role == Qt.ItemDataRole.ToolTipRole and field == 'file':
+            return self.summaries[index.row()]['path']
+        if role == Qt.ItemDataRole.TextAlignmentRole and field != 'file':
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        value = self.value(index.row(), field)
+        if value is None or field in ('file', 'rows'):
+            return "" if value is None else str(value)
+        return f"{value:.{TIME_UNIT_DECIMALS[self.time_unit]}f}" if field.endswith("_s") else f"{value:.2f}"
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Vertical:
+            return str(section + 1)
+        return self.columns[section][1]
+
+class Session:
+    # Several experiments shown together on shared axes. Files are loaded
+    # concurrently on a thread pool (the CSV parsers release the GIL), and
+    # each keeps only its time and selected pressure/temperature columns.
+    def __init__(self):
+        self.experiments = []
+        self.errors = []
+
+    def load(self, files, pressure_sensor_num, temperature_sensor_num, divide_pressure_by=1.0, divide_temp_by=10.0, workers=None, progress=None, cancelled=None):
+        loaded = {}
+        self.errors = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(load_experiment, file_path, pressure_sensor_num, temperature_sensor_num, divide_pressure_by, divide_temp_by): file_path for file_path in files}
+            for done, future in enumerate(as_completed(futures), 1):
+                file_path = futures[future]
+                try:
+                    loaded[file_path] = future.result()[0]
+                except Exception as e:
+                    self.errors.append((file_path, e))
+
+                if progress is not None:
+                    progress(done, len(files))
+                if cancelled is not None and cancelled():
+                    for pending in futures:
+                        pending.cancel()
+                    raise LoadCancelled()
+
+        # Legend order follows the order the files were given in
+        self.experiments = [(os.path.splitext(os.path.basename(file_path))[0], loaded[file_path]) for file_path in files if file_path in loaded]
+        return self
+
+def draw_overlay(ax, experiments, settings):
+    # Every experiment as its own series on the same axes, in one pass
+    budget = point_budget(ax.figure, settings['dpi'])
+    for name, experiment in experiments:
+        experiment.set_divisors(settings['divide_pressure_by'], settings['divide_temp_by'])
+        experiment.set_gas(settings['gas'], settings['gas_volume'])
+        data_x, data_y = experiment.select(settings['x_var'], settings['y_var'], settings['time_unit'], resample_spec(settings))
+        data_x, data_y = decimate_series(data_x, data_y, settings.get('decimation'), budget)
+        if settings['plot_style'] == "line":
+            ax.plot(data_x, data_y, linewidth=settings['line_width'], label=name)
+        elif settings['plot_style'] == "scatter":
+            ax.scatter(data_x, data_y, s = settings['line_width'] * 2, label=name)
+
+    ax.legend(fontsize="small", frameon=False)
+    apply_axes_settings(ax, settings)
+
+def draw_channels(fig, channels, settings):
+    # Every active channel against time in one figure: a subplot each on a
+    # shared time axis, or pressure on the left and temperature on a twin
+    # right Y axis. Returns the axes.
+    channels.divide_pressure_by, channels.divide_temp_by = float(settings['divide_pressure_by']), float(settings['divide_temp_by'])
+    budget = point_budget(fig, settings['dpi'])
+    resample = resample_spec(settings)
+    bins = time_bins(channels.time_sec, resample[0]) if resample is not None and resample[1] != 'rolling' else None
+    keys = channels.active()
+    if not keys:
+        raise ValueError("no channel in this log has any data")
+
+    if settings['layout'] == 'twin':
+        ax = fig.add_subplot()
+        axes = {'pressure': ax, 'temperature': ax.twinx()}
+    else:
+        axes = dict(zip(keys, fig.subplots(len(keys), 1, sharex=True, squeeze=False)[:, 0]))
+
+    handles = []
+    for i, (var, sensor_num) in enumerate(keys):
+        ax = axes[var] if settings['layout'] == 'twin' else axes[(var, sensor_num)]
+        label = f"{VARIABLE_LABELS[var]} {sensor_num}"
+        time_sec, values = channels.time_sec, channels.series(var, sensor_num)
+        if resample is not None:
+            time_sec, values = resample_series(time_sec, values, *resample, bins)
+        data_x, data_y = decimate_series(time_sec / TIME_UNIT_SECONDS[settings['time_unit']], values, settings.get('decimation'), budget)
+        if settings['plot_style'] == "line":
+            handles += ax.plot(data_x, data_y, color=f"C{i}", linewidth=settings['line_width'], label=label)
+        elif settings['plot_style'] == "scatter":
+            handles.append(ax.scatter(data_x, data_y, color=f"C{i}", s = settings['line_width'] * 2, label=label))
+        if settings['layout'] == 'twin':
+            ax.set_ylabel(VARIABLE_LABELS[var])
+        else:
+            # A y label per stacked subplot would not fit; each names its channel in a legend
+            ax.legend(handles=handles[-1:], loc="best", fontsize="small", frameon=False)
+
+    # The time axis is shared, so only the bottom one is labelled and limited
+    bottom = axes['pressure'] if settings['layout'] == 'twin' else axes[keys[-1]]
+    bottom.set_xlabel(axis_labels(dict(settings, x_var='time'))[0])
+    x_scale = parse_scale(settings.get('x_scale'))
+    if x_scale is not None:
+        bottom.set_xlim(*x_scale)
+    if settings['layout'] == 'twin':
+        bottom.legend(handles=handles, fontsize="small", frameon=False)
+    return list(axes.values())
+
+class LivePlot:
+    # One figure that grows with a followed log. The plotted points are kept
+    # in buffers that grow by doubling, with running bounds; new points are
+    # appended there and drawn as a short segment blitted onto the saved
+    # background, so an update costs the same no matter how many points are
+    # already on screen. A full redraw only happens when the data leaves the
+    # current limits (which then grow with headroom) or when Qt repaints the
+    # canvas; series() is read again only after the log was truncated.
+    def __init__(self, canvas, settings, series):
+        self.canvas = canvas
+        self.settings = settings
+        self.series = series
+        self.fig = canvas.figure
+        self.ax = self.fig.add_subplot()
+
+        style = dict(color="black", linewidth=settings['line_width'])
+        if settings['plot_style'] == "scatter":
+            style = dict(color="black", linestyle="none", marker="o", markersize=settings['line_width'])
+        self.line, = self.ax.plot([], [], **style)
+        self.segment, = self.ax.plot([], [], animated=True, **style)
+        apply_axes_settings(self.ax, settings)
+
+        self.background = None
+        self.line_stale = False
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+        self.redraw(reload=True)
+
+    def points(self):
+        return self.buffers[0][:self.size], self.buffers[1][:self.size]
+
+    def store(self, new_x, new_y):
+        n = len(new_x)
+        if self.size + n > self.buffers.shape[1]:
+            grown = np.empty((2, max(2 * self.buffers.shape[1], self.size + n)))
+            grown[:, :self.size] = self.buffers[:, :self.size]
+            self.buffers = grown
+        self.buffers[0][self.size:self.size + n] = new_x
+        self.buffers[1][self.size:self.size + n] = new_y
+        self.size += n
+        if n:
+            # fmin/fmax skip NaN, so an all-NaN block (no uptake yet) leaves the bounds as they are
+            x_lo, x_hi, y_lo, y_hi = self.bounds
+            self.bounds = [np.fmin.reduce(new_x, initial=x_lo), np.fmax.reduce(new_x, initial=x_hi), np.fmin.reduce(new_y, initial=y_lo), np.fmax.reduce(new_y, initial=y_hi)]
+
+    def on_draw(self, event):
+        if self.line_stale:
+            # Qt repainted with an outdated line; refresh it and draw once more
+            self.line_stale = False
+            self.line.set_data(*self.points())
+            self.canvas.draw_idle()
+            return
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def expand_limits(self):
+        # Grow the limits past the data so they rarely need to change again
+        x_lo, x_hi, y_lo, y_hi = self.bounds
+        if self.settings.get('x_scale') is None and np.isfinite(x_lo):
+            width = (x_hi - x_lo) or 1.0
+            self.ax.set_xlim(x_lo, x_hi + width)
+        if self.settings.get('y_scale') is None and np.isfinite(y_lo):
+            height = (y_hi - y_lo) or 1.0
+            self.ax.set_ylim(y_lo - 0.25 * height, y_hi + 0.25 * height)
+
+    def fits(self):
+        (x0, x1), (y0, y1) = self.ax.get_xlim(), self.ax.get_ylim()
+        x_lo, x_hi, y_lo, y_hi = self.bounds
+        x_ok = self.settings.get('x_scale') is not None or not np.isfinite(x_lo) or (x_lo >= x0 and x_hi <= x1)
+        y_ok = self.settings.get('y_scale') is not None or not np.isfinite(y_lo) or (y_lo >= y0 and y_hi <= y1)
+        return x_ok and y_ok
+
+    def redraw(self, reload=False):
+        # reload=True reads every point from series() again (a new or truncated log)
+        if reload:
+            self.buffers = np.empty((2, 1024))
+            self.size = 0
+            self.bounds = [np.nan] * 4
+            self.store(*self.series())
+        self.line.set_data(*self.points())
+        self.line_stale = False
+        self.expand_limits()
+        self.canvas.draw()
+
+    def append(self, new_x, new_y):
+        if len(new_x) == 0:
+            return
+        last = (self.buffers[0][self.size - 1], self.buffers[1][self.size - 1]) if self.size else None
+        self.store(new_x, new_y)
+        if self.background is None or not self.fits():
+            self.redraw()
+            return
+
+        # Draw only the new points (joined to the previous one) on top of the saved frame
+        if last is not None:
+            new_x = np.concatenate(([last[0]], new_x))
+            new_y = np.concatenate(([last[1]], new_y))
+        self.segment.set_data(new_x, new_y)
+        self.canvas.restore_region(self.background)
+        self.ax.draw_artist(self.segment)
+        self.canvas.blit(self.ax.bbox)
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.line_stale = True
+
+def view_limits(fig):
+    # Axis limits of every axes; a toolbar zoom changes these but not the spec
+    return tuple((*ax.get_xlim(), *ax.get_ylim()) for ax in fig.axes)
+
+def frozen(value):
+    # A hashable copy of a settings value (scales may arrive as lists)
+    return tuple(frozen(item) for item in value) if isinstance(value, (list, tuple)) else value
+
+class PlotSpec:
+    # Everything that decides what a plot looks like: the dataset (its unique
+    # version, with the row count for a followed log that grows) and every plot setting - variables, time unit, divisors, gas,
+    # resampling, limits, labels, style, DPI and export options. Equal specs
+    # draw equal figures, so a spec keys the rendered previews and exports.
+    __slots__ = ("dataset", "fields", "_hash")
+
+    def __init__(self, dataset, settings):
+        self.dataset = dataset
+        self.fields = tuple((name, frozen(settings[name])) for name in sorted(settings))
+        self._hash = hash((self.dataset, self.fields))
+
+    def __eq__(self, other):
+        return isinstance(other, PlotSpec) and self.dataset == other.dataset and self.fields == other.fields
+
+    def __hash__(self):
+        return self._hash
+
+class RenderCache:
+    # Memory-bounded LRU of rendered plots keyed by (PlotSpec, ...): preview
+    # pixels and exported file bytes. Least recently used entries go first
+    # once the total passes max_bytes. Saving runs on the thread pool, hence the lock.
+    def __init__(self, max_bytes=None):
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get(RENDER_CACHE_ENV, DEFAULT_RENDER_CACHE_MB)) * 2**20)
+        self.max_bytes = max_bytes
+        self.entries = collections.OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, size):
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self.entries[key] = (value, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted
+
+class PlotView:
+    # The one preview figure, reused for every plot instead of a new pyplot
+    # figure per click. A new data selection swaps the data of the existing
+    # line, a line/scatter switch replaces the artist, and labels, limits,
+    # line width or DPI only restyle what is already there. With a min/max
+    # pyramid of the series only the visible time range is drawn, re-read
+    # from the pyramid on every zoom or pan. With a RenderCache, a spec drawn
+    # before at the same canvas size gets its pixels and layout back instead
+    # of a new layout and draw.
+    def __init__(self, cache=None):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+
+        self.fig = Figure()
+        self.canvas = FigureCanvasQTAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        self.artist = None
+        self.data_key = None
+        self.plot_style = None
+        self.budget = 0
+        self.data_x, self.data_y = None, None
+        self.pyramid = None
+        self.refreshing = False
+        self.event_artists = []
+        self.cache = cache
+        self.ax.callbacks.connect("xlim_changed", self.on_xlim_changed)
+
+    def reset_axes(self):
+        # Clean axes forget the old artist's limits; clearing also drops the axes callbacks
+        if self.ax is None:
+            # After a multi-channel layout, which owns the whole figure
+            self.fig.clear()
+            self.ax = self.fig.add_subplot()
+        else:
+            self.ax.cla()
+        self.event_artists = []
+        self.ax.callbacks.connect("xlim_changed", self.on_xlim_changed)
+
+    def visible_index(self, x_range, budget):
+        # Rows inside x_range (binary search on the sorted time axis), thinned by the pyramid
+        start, stop = 0, len(self.data_x)
+        if x_range is not None:
+            lo, hi = sorted(x_range)
+            start, stop = np.searchsorted(self.data_x, lo, side="left"), np.searchsorted(self.data_x, hi, side="right")
+        return self.pyramid.query(int(start), int(stop), budget)
+
+    def preview_key(self, spec):
+        # The same spec at another window size or screen scale is other pixels
+        if spec is None or self.cache is None:
+            return None
+        return (spec, "preview", *self.canvas.get_width_height(physical=True), self.fig.dpi)
+
+    def restore(self, spec):
+        # Cached render of this spec: the tight layout's subplot parameters and
+        # the Agg buffer go back in place of tight_layout() and draw()
+        key = self.preview_key(spec)
+        cached = None if key is None else self.cache.get(key)
+        if cached is None:
+            return False
+        region, subplot_params, limits = cached
+        if limits != view_limits(self.fig):
+            return False
+        with span("cached preview"):
+            self.fig.subplots_adjust(**subplot_params)
+            self.canvas.restore_region(region)
+            self.canvas.blit()
+        return True
+
+    def finish(self, spec):
+        # Lay out and draw, then keep the result for the next time this spec comes up
+        with span("layout"):
+            self.fig.tight_layout()
+
+        # Drawn now rather than on the next idle tick, so the time shows up
+        # in the plot trace; the preview repaints from this render
+        with span("draw"):
+            self.canvas.draw()
+
+        key = self.preview_key(spec)
+        if key is not None:
+            region = self.canvas.copy_from_bbox(self.fig.bbox)
+            params = self.fig.subplotpars
+            subplot_params = {name: getattr(params, name) for name in ("left", "bottom", "right", "top", "wspace", "hspace")}
+            self.cache.put(key, (region, subplot_params, view_limits(self.fig)), key[2] * key[3] * 4)
+
+    def update(self, data_x, data_y, settings, data_key, events=None, pyramid=None, spec=None):
+        budget = point_budget(self.fig, settings['dpi'])
+        new_data = data_key != self.data_key or budget > self.budget
+        self.data_x, self.data_y = data_x, data_y
+        self.pyramid = pyramid
+        self.refreshing = True
+        try:
+            sample = data_x, data_y
+            if pyramid is not None:
+                # Only the visible range; cheap enough to redo on every update
+                index = self.visible_index(parse_scale(settings.get('x_scale')), budget)
+                sample = data_x[index], data_y[index]
+                new_data = True
+
+            if self.artist is None or settings['plot_style'] != self.plot_style or (new_data and settings['plot_style'] != "line"):
+                # Start from clean axes so the old artist's limits are forgotten
+                self.reset_axes()
+                self.artist = draw_series(self.ax, *sample, settings)
+                self.budget = budget
+            elif new_data:
+                set_series_data(self.artist, *(sample if pyramid is not None else decimate_series(data_x, data_y, settings.get('decimation'), budget)))
+                self.ax.relim()
+                self.budget = budget
+            style_series(self.artist, settings)
+            self.data_key, self.plot_style = data_key, settings['plot_style']
+
+            # Event annotations are cheap, so they are redrawn on every update
+            for artist in self.event_artists:
+                artist.remove()
+            self.event_artists = draw_events(self.ax, events, data_x, data_y, settings) if events else []
+
+            apply_axes_settings(self.ax, settings)
+        finally:
+            self.refreshing = False
+        if not self.restore(spec):
+            self.finish(spec)
+
+    def on_xlim_changed(self, ax):
+        # Zoom or pan from the toolbar: redraw from the pyramid, O(budget) whatever the log size
+        if self.refreshing or self.pyramid is None or self.artist is None:
+            return
+        index = self.visible_index(ax.get_xlim(), self.budget)
+        set_series_data(self.artist, self.data_x[index], self.data_y[index])
+        self.canvas.draw_idle()
+
+    def use_full_data(self):
+        # Every sample, for an exact export; the next update thins it again
+        if self.artist is not None:
+            set_series_data(self.artist, self.data_x, self.data_y)
+            self.data_key = None
+
+    def show_overlay(self, experiments, settings):
+        # Overlays are redrawn whole; the next single plot starts from clean axes
+        self.reset_axes()
+        self.artist = None
+        self.pyramid = None
+        self.data_key = None
+        draw_overlay(self.ax, experiments, settings)
+        self.fig.tight_layout()
+        self.canvas.draw_idle()
+
+    def show_channels(self, channels, settings, spec=None):
+        # Multi-channel layouts take the whole figure; the next single plot gets fresh axes
+        self.fig.clear()
+        self.ax = None
+        self.artist = None
+        self.pyramid = None
+        self.data_key = None
+        self.event_artists = []
+        draw_channels(self.fig, channels, settings)
+        if not self.restore(spec):
+            self.finish(spec)
+
+# Formats the save dialog and the batch CLI can write
+EXPORT_FORMATS = ["png", "jpg", "pdf", "svg"]
+
+def agg_figure(fig=None):
+    # A figure drawn by plain Agg, with no pyplot and no Qt
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    if fig is None:
+        fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig
+
+def export_rc(settings):
+    # Agg path simplification and chunking: fewer vertices per path, and
+    # long paths drawn in chunks so the renderer never hits its cell limit
+    return {
+        'path.simplify': settings.get('simplify_threshold', 0) > 0,
+        'path.simplify_threshold': settings.get('simplify_threshold', 0),
+        'agg.path.chunksize': settings.get('agg_chunksize', 0),
+    }
+
+def set_rasterized_data(fig, rasterized):
+    # Data lines/markers as an embedded image in PDF/SVG; axes and text stay
+    # vector. Returns the previous flags, for restore_rasterized
+    previous = []
+    for ax in fig.axes:
+        for artist in ax.lines + ax.collections:
+            previous.append((artist, artist.get_rasterized()))
+            artist.set_rasterized(rasterized)
+    return previous
+
+def restore_rasterized(previous):
+    for artist, rasterized in previous:
+        artist.set_rasterized(rasterized)
+
+def save_figure(fig, output_path, settings, bbox, file_ext=None):
+    # output_path may also be a file object, with file_ext naming the format
+    from matplotlib import rc_context
+
+    file_ext = file_ext or output_path.split(".")[-1]
+    with rc_context(export_rc(settings)):
+        fig.savefig(output_path, format=file_ext, dpi=settings['dpi'], transparent=settings['transparent'], bbox_inches=bbox)
+    return output_path
+
+def save_pickled_figure(data, output_path, settings, bbox):
+    # Process pool entry point: one format from a pickled copy of the figure
+    rcparams()
+    fig = agg_figure(pickle.loads(data))
+    return save_figure(fig, output_path, settings, bbox)
+
+def export_figure(fig, output_paths, settings, workers=1):
+    # Lay the figure out once (the tight bounding box costs a full draw), then
+    # write every output with that box. With workers > 1 the formats are
+    # written concurrently from pickled copies in a process pool.
+    from matplotlib import rcParams, rc_context
+
+    previous = set_rasterized_data(fig, settings.get('rasterize', False))
+    try:
+        with span("layout"), rc_context(export_rc(settings)):
+            bbox = fig.get_tightbbox().padded(rcParams['savefig.pad_inches'])
+
+        if workers <= 1 or len(output_paths) <= 1:
+            saved = []
+            for output_path in output_paths:
+                with span(f"savefig {output_path.split('.')[-1]}") as fields:
+                    saved.append(save_figure(fig, output_path, settings, bbox))
+                    fields['bytes'] = os.path.getsize(output_path)
+            return saved
+
+        with span("savefig " + ", ".join(output_path.split(".")[-1] for output_path in output_paths)) as fields:
+            data = pickle.dumps(fig)
+            with ProcessPoolExecutor(max_workers=min(workers, len(output_paths))) as executor:
+                saved = list(executor.map(save_pickled_figure, [data] * len(output_paths), output_paths, [settings] * len(output_paths), [bbox] * len(output_paths)))
+            fields['bytes'] = sum(os.path.getsize(output_path) for output_path in saved)
+        return saved
+    finally:
+        # The figure may be shown again (the preview), so it goes back as it was
+        restore_rasterized(previous)
+
+def export_key(spec, fig, file_ext):
+    # Exported bytes of this spec in this format at the current zoom and window size
+    return (spec, "export", file_ext.lower(), view_limits(fig), tuple(fig.get_size_inches()))
+
+def uncached_exports(fig, output_paths, spec=None, cache=None):
+    # The outputs export_cached would have to render
+    if spec is None or cache is None:
+        return list(output_paths)
+    return [output_path for output_path in output_paths if cache.get(export_key(spec, fig, output_path.split(".")[-1])) is None]
+
+def export_cached(fig, output_paths, settings, spec=None, cache=None, workers=1):
+    # export_figure, except that formats already exported (or prerendered)
+    # for this spec are written from memory, and the rest are kept for the next save
+    missing = uncached_exports(fig, output_paths, spec, cache)
+    for output_path in output_paths:
+        if output_path in missing:
+            continue
+        data = cache.get(export_key(spec, fig, output_path.split(".")[-1]))
+        with span(f"cached {output_path.split('.')[-1]}", bytes=len(data)):
+            with open(output_path, "wb") as f:
+                f.write(data)
+
+    if missing:
+        export_figure(fig, missing, settings, min(workers, len(missing)))
+        if spec is not None and cache is not None:
+            for output_path in missing:
+                with open(output_path, "rb") as f:
+                    data = f.read()
+                cache.put(export_key(spec, fig, output_path.split(".")[-1]), data, len(data))
+    return list(output_paths)
+
+def prerender_exports(fig, formats, settings, spec, cache, cancelled=None):
+    # Export bytes of a previewed spec, laid out and rasterized as
+    # export_figure would, rendered into the cache while the preview is open
+    # so that saving it is only a write. Returns the formats rendered.
+    from matplotlib import rcParams, rc_context
+
+    formats = [file_ext for file_ext in formats if cache.get(export_key(spec, fig, file_ext)) is None]
+    if not formats:
+        return []
+
+    previous = set_rasterized_data(fig, settings.get('rasterize', False))
+    try:
+        with span("layout"), rc_context(export_rc(settings)):
+            bbox = fig.get_tightbbox().padded(rcParams['savefig.pad_inches'])
+
+        rendered = []
+        for file_ext in formats:
+            # A newer preview makes this one moot
+            if cancelled is not None and cancelled():
+                break
+            buffer = io.BytesIO()
+            with span(f"prerender {file_ext}") as fields:
+                save_figure(fig, buffer, settings, bbox, file_ext)
+                fields['bytes'] = buffer.tell()
+            cache.put(export_key(spec, fig, file_ext), buffer.getvalue(), buffer.tell())
+            rendered.append(file_ext)
+        return rendered
+    finally:
+        restore_rasterized(previous)
+
+def time_range_seconds(settings):
+    # settings['time_range'] (start, end) is in the selected time unit; None loads the whole log
+    if settings.get('time_range') is None:
+        return None
+    start, end = settings['time_range']
+    return start * TIME_UNIT_SECONDS[settings['time_unit']], end * TIME_UNIT_SECONDS[settings['time_unit']]
+
+def render_file(file_path, output_paths, settings):
+    # Headless load -> scale -> plot -> savefig for one file.
+    # Runs in worker processes, so it must not touch pyplot or Qt.
+    rcparams()
+
+    with traced("render", file_path):
+        if settings.get('layout', 'single') != 'single':
+            # Every channel from one parse, one figure, one savefig
+            channels = load_channels(file_path, settings['divide_pressure_by'], settings['divide_temp_by'], time_range=time_range_seconds(settings))
+            fig = agg_figure()
+            draw_channels(fig, channels, settings)
+            with span("layout"):
+                fig.tight_layout()
+            return export_figure(fig, output_paths, settings)
+
+        experiment, _ = load_experiment(file_path, settings['pressure_sensor_num'], settings['temperature_sensor_num'], settings['divide_pressure_by'], settings['divide_temp_by'], time_range=time_range_seconds(settings))
+        experiment.set_gas(settings.get('gas', 'CH4'), settings.get('gas_volume', 1.0))
+        data_x, data_y = experiment.select(settings['x_var'], settings['y_var'], settings['time_unit'], resample_spec(settings))
+        if data_x is None or data_y is None:
+            raise ValueError(f"unknown variable: x={settings['x_var']}, y={settings['y_var']}")
+
+        fig = agg_figure()
+        ax = fig.add_subplot()
+        plot_series(ax, data_x, data_y, settings)
+        if settings.get('events'):
+            draw_events(ax, experiment.events(resample_spec(settings)), data_x, data_y, settings)
+        with span("layout"):
+            fig.tight_layout()
+
+        # Already one process per file, so the formats are written in turn
+        return export_figure(fig, output_paths, settings)
+
+def render_overlay(files, output_path, settings, workers=None):
+    # Every file as one series in a single figure. Returns the files that
+    # failed to load and the error of drawing or saving the figure (or None)
+    rcparams()
+
+    session = Session().load(files, settings['pressure_sensor_num'], settings['temperature_sensor_num'], settings['divide_pressure_by'], settings['divide_temp_by'], workers)
+    if not session.experiments:
+        return session.errors, None
+
+    try:
+        fig = agg_figure()
+        ax = fig.add_subplot()
+        draw_overlay(ax, session.experiments, settings)
+        fig.tight_layout()
+
+        if os.path.dirname(output_path):
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        export_figure(fig, [output_path], settings)
+    except Exception as e:
+        return session.errors, e
+    return session.errors, None
+
+def expand_inputs(inputs):
+    # Accept files, directories (all *.csv inside) and glob patterns
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            files.extend(sorted(glob.glob(os.path.join(item, "*.csv"))))
+        elif os.path.isfile(item):
+            files.append(item)
+        else:
+            files.extend(sorted(glob.glob(item)))
+
+    # Drop duplicates but keep the order
+    return list(dict.fromkeys(files))
+
+def output_path_for(file_path, output_dir, file_ext):
+    base = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(output_dir or os.path.dirname(file_path), f"{base}.{file_ext}")
+
+def run_batch(files, settings, output_dir=None, file_exts=("png",), workers=None):
+    # Render every file across a process pool and collect (file, output, error)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(render_file, file_path, [output_path_for(file_path, output_dir, file_ext) for file_ext in file_exts], settings): file_path for file_path in files}
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                results.append((file_path, future.result(), None))
+            except Exception as e:
+                results.append((file_path, None, e))
+
+    # Report in input order, not completion order
+    order = {file_path: i for i, file_path in enumerate(files)}
+    results.sort(key=lambda result: order[result[0]])
+    return results
+
+# Watch-folder daemon: manifest file (next to the outputs), seconds between
+# folder scans, and how long a CSV must sit unmodified before it is rendered
+# (the DAQ may still be writing it)
+WATCH_MANIFEST = ".dwspapyrus-watch.json"
+WATCH_MANIFEST_VERSION = 1
+WATCH_POLL_S = 2.0
+WATCH_SETTLE_S = 5.0
+
+def settings_digest(settings, file_exts):
+    # Same digest <=> the same plots from the same data
+    return hashlib.blake2b(json.dumps([settings, list(file_exts)], sort_keys=True, default=str).encode("utf-8"), digest_size=16).hexdigest()
+
+class RenderManifest:
+    # What the watch daemon has rendered: per CSV its size, mtime, content
+    # hash, settings digest and outputs (or the error), as one JSON file
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get('version') == WATCH_MANIFEST_VERSION:
+                self.entries = data['files']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def up_to_date(self, file_path, stat, digest):
+        # Stat-only check, so an idle scan never reads the logs
+        entry = self.entries.get(file_path)
+        return (entry is not None and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns
+                and entry['settings'] == digest and (entry['error'] is not None or all(os.path.exists(output_path) for output_path in entry['outputs'])))
+
+    def record(self, file_path, stat, content, digest, outputs, error=None):
+        self.entries[file_path] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'hash': content,
+            'settings': digest,
+            'outputs': outputs,
+            'error': error,
+            'rendered': datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+
+    def save(self):
+        # Written whole and swapped in, so a killed daemon never leaves half a manifest
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({'version': WATCH_MANIFEST_VERSION, 'files': self.entries}, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+def render_if_changed(file_path, output_paths, settings, digest, previous):
+    # Watch worker: hash the log here (not in the scanning process) and only
+    # render when its content or the settings differ from the last render.
+    # Returns (content hash, rendered?)
+    content = content_hash(file_path)
+    if (previous is not None and previous['hash'] == content and previous['settings'] == digest
+            and previous['error'] is None and all(os.path.exists(output_path) for output_path in output_paths)):
+        return content, False
+    render_file(file_path, output_paths, settings)
+    return content, True
+
+def scan_folder(watch_dir, manifest, digest, settle):
+    # CSVs in watch_dir that have settled and are not in the manifest as they are now
+    now = time.time()
+    found = []
+    with os.scandir(watch_dir) as entries:
+        for entry in entries:
+            if not entry.name.lower().endswith(".csv") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            if now - stat.st_mtime >= settle and not manifest.up_to_date(entry.path, stat, digest):
+                found.append((entry.path, stat))
+    found.sort(key=lambda item: item[1].st_mtime)
+    return found
+
+def watch_folder(watch_dir, settings, output_dir=None, file_exts=("png",), workers=None, poll=WATCH_POLL_S, settle=WATCH_SETTLE_S, once=False, report=print):
+    # Render every new or changed CSV in watch_dir until interrupted (or,
+    # with once, until the folder has been drained). Between scans the
+    # process only sleeps; a burst keeps every worker busy, with at most two
+    # jobs per worker queued in the pool so changes made meanwhile are not
+    # rendered from stale submissions.
+    # Absolute paths, so the manifest keys do not depend on the working directory
+    watch_dir = os.path.abspath(watch_dir)
+    output_dir = os.path.abspath(output_dir or watch_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = RenderManifest(os.path.join(output_dir, WATCH_MANIFEST))
+    digest = settings_digest(settings, file_exts)
+    workers = workers or os.cpu_count() or 1
+
+    pending = collections.deque()
+    queued = set()
+    running = {}
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while True:
+            for file_path, stat in scan_folder(watch_dir, manifest, digest, settle):
+                if file_path not in queued:
+                    pending.append((file_path, stat))
+                    queued.add(file_path)
+
+            while pending and len(running) < 2 * workers:
+                file_path, stat = pending.popleft()
+                output_paths = [output_path_for(file_path, output_dir, file_ext) for file_ext in file_exts]
+                future = executor.submit(render_if_changed, file_path, output_paths, settings, digest, manifest.entries.get(file_path))
+                running[future] = (file_path, stat, output_paths)
+
+            if not running:
+                if once:
+                    return manifest
+                time.sleep(poll)
+                continue
+
+            done, _ = wait(running, timeout=poll, return_when=FIRST_COMPLETED)
+            for future in done:
+                file_path, stat, output_paths = running.pop(future)
+                queued.discard(file_path)
+                try:
+                    content, rendered = future.result()
+                except Exception as e:
+                    # Kept in the manifest so a broken log is retried only once it changes
+                    manifest.record(file_path, stat, None, digest, [], str(e))
+                    report(f"FAIL  {file_path}: {e}")
+                    continue
+                manifest.record(file_path, stat, content, digest, output_paths)
+                report(f"OK    {file_path} -> {', '.join(output_paths)}" if rendered else f"SKIP  {file_path} (unchanged)")
+            if done:
+                manifest.save()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def add_plot_arguments(parser):
+    # Plot options shared by the batch and watch subcommands
+    parser.add_argument("-f", "--format", default="png", help="저장 확장자, 여러 개는 쉼표로 (예: png,pdf,svg)")
+    parser.add_argument("--pressure-sensor", type=int, default=DEFAULT_SETTINGS['pressure_sensor_num'], choices=[1, 2])
+    parser.add_argument("--temperature-sensor", type=int, default=DEFAULT_SETTINGS['temperature_sensor_num'], choices=[1, 2, 3, 4])
+    parser.add_argument("--divide-pressure-by", type=float, default=DEFAULT_SETTINGS['divide_pressure_by'])
+    parser.add_argument("--divide-temp-by", type=float, default=DEFAULT_SETTINGS['divide_temp_by'])
+    parser.add_argument("-x", "--x-var", default=DEFAULT_SETTINGS['x_var'], choices=list(VARIABLE_LABELS))
+    parser.add_argument("-y", "--y-var", default=DEFAULT_SETTINGS['y_var'], choices=['temperature', 'pressure', 'moles', 'uptake'])
+    parser.add_argument("--gas", default=DEFAULT_SETTINGS['gas'], choices=list(GAS_PROPERTIES), help="기체 몰수/소모량 계산에 쓸 기체 (Peng-Robinson)")
+    parser.add_argument("--gas-volume", type=float, default=DEFAULT_SETTINGS['gas_volume'], help="반응기 안 기체 부피 (L)")
+    parser.add_argument("--x-label", default=None)
+    parser.add_argument("--y-label", default=None)
+    parser.add_argument("--time-unit", default=DEFAULT_SETTINGS['time_unit'], choices=list(TIME_UNIT_LABELS))
+    parser.add_argument("--time-range", default=None, help="이 시간 구간만 불러와요 (시작,끝; --time-unit 단위)")
+    parser.add_argument("--x-scale", default=None, help="X 값 범위 (최소,최대)")
+    parser.add_argument("--y-scale", default=None, help="Y 값 범위 (최소,최대)")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_SETTINGS['dpi'])
+    parser.add_argument("--transparent", action="store_true")
+    parser.add_argument("--line-width", type=float, default=DEFAULT_SETTINGS['line_width'])
+    parser.add_argument("--style", default=DEFAULT_SETTINGS['plot_style'], choices=list(PLOT_STYLE_KEYS.values()))
+    parser.add_argument("--decimation", default=DEFAULT_SETTINGS['decimation'], choices=list(DECIMATION_KEYS.values()), help="그리기 전 데이터 축약 방식 ('none'이면 모든 점을 그려요)")
+    parser.add_argument("--rasterize", action="store_true", help="PDF/SVG에서 데이터 선만 이미지로 넣어 파일 크기를 줄여요")
+    parser.add_argument("--simplify-threshold", type=float, default=DEFAULT_SETTINGS['simplify_threshold'], help="선 단순화 정도 (0이면 끄기)")
+    parser.add_argument("--agg-chunksize", type=int, default=DEFAULT_SETTINGS['agg_chunksize'], help="긴 선을 나눠 그리는 점 개수 (0이면 끄기)")
+    parser.add_argument("--resample", type=float, default=None, metavar="SECONDS", help="이 길이 (초)의 구간마다 집계해서 그려요 (예: 600)")
+    parser.add_argument("--aggregate", default=DEFAULT_SETTINGS['aggregate'], choices=list(AGGREGATE_KEYS.values()), help="구간 집계 방식 ('rolling'은 가운데 맞춘 이동 평균)")
+    parser.add_argument("--layout", default=DEFAULT_SETTINGS['layout'], choices=list(LAYOUT_KEYS.values()), help="'subplots'는 모든 채널을 시간 축을 공유하는 위아래 그래프로, 'twin'은 압력과 온도를 양쪽 Y축으로 그려요")
+    parser.add_argument("--events", action="store_true", help="감지한 압력 강하, 온도 변화, 정상 상태 구간을 그래프에 표시해요")
+    parser.add_argument("--cache-dir", default=None, help="불러온 데이터 캐시 폴더 (기본값: ~/.cache/dwspapyrus)")
+    parser.add_argument("--no-cache", action="store_true", help="캐시를 사용하지 않아요")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="동시에 사용할 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--timing-log", default=None, metavar="PATH", help="파일마다 단계별 소요 시간을 JSON 줄로 이 파일에 덧붙여요")
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="DWSPapyrus batch", description="DWStemp CSV 파일들을 GUI 없이 한꺼번에 그래프로 저장해요.")
+    parser.add_argument("inputs", nargs="+", help="CSV 파일, 폴더 또는 glob 패턴 (예: 'logs/*.csv')")
+    parser.add_argument("-o", "--output-dir", default=None, help="그래프 저장 폴더 (기본값: CSV 파일과 같은 폴더)")
+    parser.add_argument("--overlay", default=None, metavar="OUTPUT", help="모든 파일을 겹쳐서 이 파일 하나로 저장해요 (예: overlay.png; 상대 경로는 -o 폴더 기준)")
+    add_plot_arguments(parser)
+    return parser
+
+def settings_from_args(args):
+    # Worker processes read the cache settings from the environment
+    if args.cache_dir:
+        os.environ[CACHE_DIR_ENV] = args.cache_dir
+    if args.no_cache:
+        os.environ[CACHE_DISABLE_ENV] = "1"
+    if args.timing_log:
+        os.environ[TIMING_LOG_ENV] = os.path.abspath(args.timing_log)
+
+    settings = dict(DEFAULT_SETTINGS)
+    settings.update({
+        'pressure_sensor_num': args.pressure_sensor,
+        'temperature_sensor_num': args.temperature_sensor,
+        'divide_pressure_by': args.divide_pressure_by,
+        'divide_temp_by': args.divide_temp_by,
+        'x_var': args.x_var,
+        'y_var': args.y_var,
+        'x_label': args.x_label,
+        'y_label': args.y_label,
+        'time_unit': args.time_unit,
+        'time_range': parse_scale(args.time_range),
+        'x_scale': parse_scale(args.x_scale),
+        'y_scale': parse_scale(args.y_scale),
+        'dpi': args.dpi,
+        'transparent': args.transparent,
+        'line_width': args.line_width,
+        'plot_style': args.style,
+        'decimation': args.decimation,
+        'rasterize': args.rasterize,
+        'simplify_threshold': args.simplify_threshold,
+        'agg_chunksize': args.agg_chunksize,
+        'events': args.events,
+        'layout': args.layout,
+        'gas': args.gas,
+        'gas_volume': args.gas_volume,
+        'resample': args.resample,
+        'aggregate': args.aggregate,
+    })
+    return settings
+
+def formats_from_args(args):
+    # The --format extensions, or None (after printing why) if any is unsupported
+    file_exts = [file_ext.strip().lower() for file_ext in args.format.split(",") if file_ext.strip()]
+    unknown = [file_ext for file_ext in file_exts if file_ext not in EXPORT_FORMATS]
+    if unknown or not file_exts:
+        print(f"ERROR Unsupported format: {', '.join(unknown) or args.format} (choose from {', '.join(EXPORT_FORMATS)})", file=sys.stderr)
+        return None
+    return file_exts
+
+def main_batch(argv):
+    args = build_arg_parser().parse_args(argv)
+    settings = settings_from_args(args)
+    file_exts = formats_from_args(args)
+    if file_exts is None:
+        return 2
+
+    files = expand_inputs(args.inputs)
+    if not files:
+        print("ERROR No CSV files matched the given inputs.", file=sys.stderr)
+        return 2
+
+    if args.overlay:
+        # A relative overlay path lands in the output folder, like the per-file plots
+        output_path = os.path.join(args.output_dir, args.overlay) if args.output_dir else args.overlay
+        errors, output_error = render_overlay(files, output_path, settings, args.workers)
+        errors = dict(errors)
+        for file_path in files:
+            if file_path in errors:
+                print(f"FAIL  {file_path}: {errors[file_path]}")
+            else:
+                print(f"OK    {file_path}")
+        if output_error is not None:
+            print(f"FAIL  {output_path}: {output_error}")
+        elif len(errors) < len(files):
+            print(f"{len(files) - len(errors)} series overlaid -> {output_path}")
+        return 1 if errors or output_error is not None else 0
+
+    results = run_batch(files, settings, args.output_dir, file_exts, args.workers)
+
+    # Per-file summary
+    failed = 0
+    for file_path, output_paths, error in results:
+        if error is None:
+            print(f"OK    {file_path} -> {', '.join(output_paths)}")
+        else:
+            failed += 1
+            print(f"FAIL  {file_path}: {error}")
+    print(f"{len(results) - failed} succeeded, {failed} failed, {len(results)} total")
+    return 1 if failed else 0
+
+def main_archive(argv):
+    parser = argparse.ArgumentParser(prog="DWSPapyrus archive", description="DWStemp CSV 파일들을 실험별로 나눈 Parquet 아카이브로 변환해요.")
+    parser.add_argument("inputs", nargs="+", help="CSV 파일, 폴더 또는 glob 패턴 (예: 'logs/*.csv')")
+    parser.add_argument("-o", "--archive", required=True, help="아카이브 폴더 (이미 있으면 바뀐 파일만 다시 변환해요)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="동시에 사용할 프로세스 수 (기본값: CPU 코어 수)")
+    args = parser.parse_args(argv)
+
+    files = expand_inputs(args.inputs)
+    if not files:
+        print("ERROR No CSV files matched the given inputs.", file=sys.stderr)
+        return 2
+    try:
+        results = convert_logs(files, args.archive, args.workers)
+    except RuntimeError as e:
+        print(f"ERROR {e}", file=sys.stderr)
+        return 2
+
+    # Per-file summary
+    failed = 0
+    for file_path, name, converted, error in results:
+        if error is not None:
+            failed += 1
+            print(f"FAIL  {file_path}: {error}")
+        else:
+            print(f"{'OK' if converted else 'SKIP':<5} {file_path} -> {name}")
+    print(f"{len(results) - failed} archived, {failed} failed, {len(results)} total")
+    return 1 if failed else 0
+
+def main_watch(argv):
+    parser = argparse.ArgumentParser(prog="DWSPapyrus watch", description="폴더를 지켜보다가 새로 들어오거나 바뀐 DWStemp CSV 파일을 그래프로 저장해요.")
+    parser.add_argument("folder", help="지켜볼 폴더")
+    parser.add_argument("-o", "--output-dir", default=None, help="그래프 저장 폴더 (기본값: 지켜보는 폴더)")
+    parser.add_argument("--poll", type=float, default=WATCH_POLL_S, help="폴더를 다시 확인하는 간격 (초)")
+    parser.add_argument("--settle", type=float, default=WATCH_SETTLE_S, help="이 시간 (초) 동안 바뀌지 않은 파일만 그려요 (아직 기록 중인 파일 건너뛰기)")
+    parser.add_argument("--once", action="store_true", help="지금 있는 파일만 처리하고 끝내요")
+    add_plot_arguments(parser)
+    args = parser.parse_args(argv)
+
+    settings = settings_from_args(args)
+    file_exts = formats_from_args(args)
+    if file_exts is None:
+        return 2
+    if not os.path.isdir(args.folder):
+        print(f"ERROR Not a folder: {args.folder}", file=sys.stderr)
+        return 2
 
-    # Add minor ticks
-    rcParams['xtick.minor.visible'] = True
-    rcParams['ytick.minor.visible'] = True
+    report = lambda line: print(line, flush=True)
+    report(f"Watching {os.path.abspath(args.folder)} (Ctrl+C to stop)")
+    try:
+        manifest = watch_folder(args.folder, settings, args.output_dir, file_exts, args.workers, args.poll, args.settle, args.once, report)
+    except KeyboardInterrupt:
+        return 0
+    failed = sum(entry['error'] is not None for entry in manifest.entries.values())
+    return 1 if failed else 0
 
-    # Tick width
-    rcParams['xtick.major.width'] = 1
-    rcParams['ytick.major.width'] = 1
-    rcParams['xtick.minor.width'] = 0.5
-    rcParams['ytick.minor.width'] = 0.5
+def main_summary(argv):
+    parser = argparse.ArgumentParser(prog="DWSPapyrus summary", description="DWStemp CSV 파일마다 기간, 행 수, 채널별 최소/최대/평균/표준편차를 계산해 요약표로 만들어요.")
+    parser.add_argument("inputs", nargs="+", help="CSV 파일, 폴더 또는 glob 패턴 (예: 'logs/*.csv')")
+    parser.add_argument("--index", default=None, help=f"요약 인덱스 (SQLite) 파일 (기본값: 파일들이 있는 폴더의 {SUMMARY_INDEX})")
+    parser.add_argument("-o", "--output", default=None, help="요약표를 이 CSV 파일로 저장해요")
+    parser.add_argument("--divide-pressure-by", type=float, default=DEFAULT_SETTINGS['divide_pressure_by'])
+    parser.add_argument("--divide-temp-by", type=float, default=DEFAULT_SETTINGS['divide_temp_by'])
+    parser.add_argument("-j", "--workers", type=int, default=None, help="동시에 사용할 프로세스 수 (기본값: CPU 코어 수)")
+    args = parser.parse_args(argv)
 
-    # Tick length
-    rcParams['xtick.major.size'] = 5
-    rcParams['ytick.major.size'] = 5
-    rcParams['xtick.minor.size'] = 3
-    rcParams['ytick.minor.size'] = 3
+    files = expand_inputs(args.inputs)
+    if not files:
+        print("ERROR No CSV files matched the given inputs.", file=sys.stderr)
+        return 2
+    index_path = args.index or summary_index_path(os.path.commonpath([os.path.dirname(os.path.abspath(file_path)) for file_path in files]))
 
-    # Tick color
-    rcParams['xtick.color'] = 'black'
-    rcParams['ytick.color'] = 'black'
+    summaries, summarized, reused, errors = index_logs(files, index_path, args.workers)
+    for file_path, error in errors:
+        print(f"FAIL  {file_path}: {error}")
 
-    rcParams['font.size'] = 14
-    rcParams['axes.titlepad'] = 10
-    rcParams['axes.titleweight'] = 'normal'
-    rcParams['axes.titlesize'] = 18
+    if args.output:
+        import csv
 
-    # Axes settings
-    rcParams['axes.labelweight'] = 'normal'
-    rcParams['xtick.labelsize'] = 12
-    rcParams['ytick.labelsize'] = 12
-    rcParams['axes.labelsize'] = 16
-    rcParams['xtick.direction'] = 'in'
-    rcParams['ytick.direction'] = 'in'
+        fields = ['path'] + summary_fields()
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(fields)
+            for summary in summaries:
+                summary = scaled_summary(summary, args.divide_pressure_by, args.divide_temp_by)
+                writer.writerow(["" if summary[field] is None else summary[field] for field in fields])
+    print(f"{len(summaries)} summarized ({summarized} computed, {reused} reused), {len(errors)} failed -> {index_path}")
+    return 1 if errors else 0
 
 # Create the main window class
 class DWSPapyrusGUI(QMainWindow):
@@ -68,6 +3100,13 @@ class DWSPapyrusGUI(QMainWindow):
 
         # Set window properties
         self.setWindowTitle("DWSPapyrus")
+
+        # Rendered previews and exports by plot spec, so revisiting a plot is instant
+        self.render_cache = RenderCache()
+        # Held while export bytes are rendered, so a save waits for the prerender of its spec
+        self.export_lock = threading.Lock()
+        self.export_formats = ["png"]
+        self.prerender_worker = None
         
         # Initialize UI components
         self.initUI()
@@ -137,6 +3176,8 @@ class DWSPapyrusGUI(QMainWindow):
         self.temperature_dropdown = QComboBox()
         self.temperature_dropdown.addItems(['1', '2', '3', '4'])
         self.load_button = QPushButton("데이터 불러오기")
+        self.follow_button = QPushButton("실시간 모니터링")
+        self.archive_button = QPushButton("아카이브에서 불러오기")
 
         # Add the function to divide pressure by:
         hlayout = QHBoxLayout()
@@ -157,6 +3198,18 @@ class DWSPapyrusGUI(QMainWindow):
         hlayout.addWidget(self.divide_temp_by)
         layout.addLayout(hlayout)
 
+        # Load only a time window of the log (in the selected time unit)
+        line = QFrame()
+        line.setFrameShape(QFrame.Shape.HLine)
+        line.setFrameShadow(QFrame.Shadow.Sunken)
+        layout.addWidget(line)
+
+        hlayout = QHBoxLayout()
+        hlayout.addWidget(QLabel("불러올 시간 구간 (시작, 끝 / 비우면 전체):"), alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.time_range = QLineEdit("")
+        hlayout.addWidget(self.time_range)
+        layout.addLayout(hlayout)
+
         # Dividing section with line 
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
@@ -176,9 +3229,13 @@ class DWSPapyrusGUI(QMainWindow):
         hlayout.addWidget(QLabel("사용한 온도 센서 번호 선택:"))
         hlayout.addWidget(self.temperature_dropdown)
         hlayout.addWidget(self.load_button)
+        hlayout.addWidget(self.archive_button)
+        hlayout.addWidget(self.follow_button)
         layout.addLayout(hlayout)
 
         self.load_button.clicked.connect(self.load_csv)
+        self.archive_button.clicked.connect(self.load_archive)
+        self.follow_button.clicked.connect(self.follow_csv)
 
         # Dividing section with line 
         line = QFrame()
@@ -186,13 +3243,31 @@ class DWSPapyrusGUI(QMainWindow):
         line.setFrameShadow(QFrame.Shadow.Sunken)
         layout.addWidget(line)
 
-        # Create the Data preview section
+        # Create the Data preview section: every loaded row, formatted only as it scrolls into view
         self.data_preview_widget = QWidget()
         self.data_preview_layout = QVBoxLayout()
-        self.data_preview = QTextEdit()
+        self.table_model = ExperimentTableModel(self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.table_model)
+        self.data_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        # Fixed row heights, so the view never measures rows it does not show
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.data_table.verticalHeader().setDefaultSectionSize(self.data_table.fontMetrics().height() + 6)
+        self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.data_preview_layout.addWidget(QLabel("불러온 데이터 미리보기:"))
-        self.data_preview_layout.addWidget(self.data_preview)
+        self.data_preview_layout.addWidget(self.data_table)
+
+        # Jump to a time (in the selected time unit)
+        jump_layout = QHBoxLayout()
+        self.jump_time = QLineEdit("")
+        self.jump_button = QPushButton("이동")
+        jump_layout.addWidget(QLabel("시간으로 이동:"))
+        jump_layout.addWidget(self.jump_time)
+        jump_layout.addWidget(self.jump_button)
+        self.data_preview_layout.addLayout(jump_layout)
         self.data_preview_widget.setLayout(self.data_preview_layout)
+        self.jump_time.returnPressed.connect(self.jump_to_time)
+        self.jump_button.clicked.connect(self.jump_to_time)
 
         # Create the Treated data section
         self.treated_data_widget = QWidget()
@@ -219,7 +3294,7 @@ class DWSPapyrusGUI(QMainWindow):
         self.x_var_dropdown = QComboBox()
         self.x_var_dropdown.addItems(['시간', '온도', '압력'])
         self.y_var_dropdown = QComboBox()
-        self.y_var_dropdown.addItems(['온도', '압력'])
+        self.y_var_dropdown.addItems(['온도', '압력', '기체 소모량'])
         self.x_label = QLineEdit("Time")
         self.y_label = QLineEdit("Temperature")
         self.x_scale = QLineEdit("")
@@ -232,7 +3307,8 @@ class DWSPapyrusGUI(QMainWindow):
         self.variable_labels = {
             '시간': 'Time',
             '온도': 'Temperature',
-            '압력': 'Pressure'
+            '압력': 'Pressure',
+            '기체 소모량': 'Gas uptake (mol)'
         }
 
         # Connect dropdowns to label update function
@@ -253,6 +3329,24 @@ class DWSPapyrusGUI(QMainWindow):
         hlayout.addWidget(self.y_var_dropdown)
         layout.addLayout(hlayout)
 
+        # Gas and volume for the gas uptake (Peng-Robinson)
+        hlayout = QHBoxLayout()
+        self.gas_dropdown = QComboBox()
+        self.gas_dropdown.addItems(list(GAS_PROPERTIES))
+        hlayout.addWidget(QLabel("기체 종류 선택:"))
+        hlayout.addWidget(self.gas_dropdown)
+
+        # Dividing section with line
+        line = QFrame()
+        line.setFrameShape(QFrame.Shape.VLine)
+        line.setFrameShadow(QFrame.Shadow.Sunken)
+        hlayout.addWidget(line)
+
+        self.gas_volume = QLineEdit("1")
+        hlayout.addWidget(QLabel("반응기 기체 부피 (L):"))
+        hlayout.addWidget(self.gas_volume)
+        layout.addLayout(hlayout)
+
         hlayout = QHBoxLayout()
         hlayout.addWidget(QLabel("X 라벨명 작성 (영어로):"))
         hlayout.addWidget(self.x_label)
@@ -318,6 +3412,7 @@ class DWSPapyrusGUI(QMainWindow):
         
         # Connect the signals
         self.time_unit_dropdown.currentTextChanged.connect(self.update_time_label)
+        self.time_unit_dropdown.currentTextChanged.connect(lambda text: self.table_model.set_time_unit(TIME_UNIT_KEYS[text]))
 
         hlayout.addWidget(QLabel("시간 단위 선택:"))
         hlayout.addWidget(self.time_unit_dropdown)
@@ -328,6 +3423,21 @@ class DWSPapyrusGUI(QMainWindow):
         line.setFrameShadow(QFrame.Shadow.Sunken)
         hlayout.addWidget(line)
 
+        # Bin width and statistic of the aggregation before plotting
+        self.resample_dropdown = QComboBox()
+        self.resample_dropdown.addItems(list(RESAMPLE_KEYS))
+        self.aggregate_dropdown = QComboBox()
+        self.aggregate_dropdown.addItems(list(AGGREGATE_KEYS))
+        hlayout.addWidget(QLabel("구간 집계:"))
+        hlayout.addWidget(self.resample_dropdown)
+        hlayout.addWidget(self.aggregate_dropdown)
+
+        # Dividing section with line
+        line = QFrame()
+        line.setFrameShape(QFrame.Shape.VLine)
+        line.setFrameShadow(QFrame.Shadow.Sunken)
+        hlayout.addWidget(line)
+
         # Line or scatter
         self.line_or_scatter = QComboBox()
         self.line_or_scatter.addItems(['선', '점'])
@@ -335,6 +3445,60 @@ class DWSPapyrusGUI(QMainWindow):
         hlayout.addWidget(self.line_or_scatter)
         layout.addLayout(hlayout)
 
+        # Decimation before drawing
+        hlayout = QHBoxLayout()
+        self.decimation_dropdown = QComboBox()
+        self.decimation_dropdown.addItems(list(DECIMATION_KEYS))
+        hlayout.addWidget(QLabel("데이터 축약 방식 선택:"))
+        hlayout.addWidget(self.decimation_dropdown)
+
+        # Dividing section with line
+        line = QFrame()
+        line.setFrameShape(QFrame.Shape.VLine)
+        line.setFrameShadow(QFrame.Shadow.Sunken)
+        hlayout.addWidget(line)
+
+        self.exact_export = QCheckBox("저장 시 모든 점 사용")
+        hlayout.addWidget(QLabel("체크 시 축약 없이 저장!"))
+        hlayout.addWidget(self.exact_export)
+        layout.addLayout(hlayout)
+
+        # Detected events on the plot
+        hlayout = QHBoxLayout()
+        self.show_events = QCheckBox("이벤트 표시")
+        hlayout.addWidget(QLabel("체크 시 압력 강하, 온도 변화, 정상 상태 구간을 그래프에 표시!"))
+        hlayout.addWidget(self.show_events)
+
+        # Dividing section with line
+        line = QFrame()
+        line.setFrameShape(QFrame.Shape.VLine)
+        line.setFrameShadow(QFrame.Shadow.Sunken)
+        hlayout.addWidget(line)
+
+        # Several channels in one figure (loaded together in one pass)
+        self.layout_dropdown = QComboBox()
+        self.layout_dropdown.addItems(list(LAYOUT_KEYS))
+        hlayout.addWidget(QLabel("그래프 배치 선택:"))
+        hlayout.addWidget(self.layout_dropdown)
+        layout.addLayout(hlayout)
+
+        # Export options
+        hlayout = QHBoxLayout()
+        self.multi_export = QCheckBox("PNG, PDF, SVG 동시 저장")
+        hlayout.addWidget(QLabel("체크 시 세 형식으로 한 번에 저장!"))
+        hlayout.addWidget(self.multi_export)
+
+        # Dividing section with line
+        line = QFrame()
+        line.setFrameShape(QFrame.Shape.VLine)
+        line.setFrameShadow(QFrame.Shadow.Sunken)
+        hlayout.addWidget(line)
+
+        self.rasterize = QCheckBox("PDF, SVG의 데이터 선을 이미지로")
+        hlayout.addWidget(QLabel("체크 시 벡터 파일 용량 줄이기!"))
+        hlayout.addWidget(self.rasterize)
+        layout.addLayout(hlayout)
+
         # Dividing section with line 
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
@@ -353,6 +3517,20 @@ class DWSPapyrusGUI(QMainWindow):
         line.setFrameShadow(QFrame.Shadow.Sunken)
         hlayout.addWidget(line)
 
+        self.overlay_button = QPushButton("여러 실험 겹쳐 그리기")
+        self.overlay_button.clicked.connect(self.load_overlay)
+        hlayout.addWidget(self.overlay_button)
+
+        self.summary_button = QPushButton("실험 요약표")
+        self.summary_button.clicked.connect(self.load_summary)
+        hlayout.addWidget(self.summary_button)
+
+        # Dividing section with line
+        line = QFrame()
+        line.setFrameShape(QFrame.Shape.VLine)
+        line.setFrameShadow(QFrame.Shadow.Sunken)
+        hlayout.addWidget(line)
+
         self.exit_button = QPushButton("종료하기")
         self.exit_button.clicked.connect(self.close)
         hlayout.addWidget(self.exit_button)
@@ -360,124 +3538,645 @@ class DWSPapyrusGUI(QMainWindow):
         layout.addLayout(hlayout)
         central_widget.setLayout(layout)
 
+        # Status area: the last operation's timing breakdown, a one-shot
+        # profiler switch, and progress of background loading and saving
+        self.timing_label = QLabel()
+        self.timing_label.setMinimumWidth(1)
+        self.statusBar().addWidget(self.timing_label, 1)
+        self.profile_button = QPushButton("프로파일")
+        self.profile_button.setCheckable(True)
+        self.profile_button.setToolTip("켜 두면 다음 작업 하나를 cProfile로 기록해요")
+        self.statusBar().addPermanentWidget(self.profile_button)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.cancel_button = QPushButton("취소")
+        self.cancel_button.clicked.connect(self.cancel_task)
+        self.statusBar().addPermanentWidget(self.progress_bar)
+        self.statusBar().addPermanentWidget(self.cancel_button)
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.task = None
+        # The operation whose breakdown the timing label shows
+        self.trace = None
+
     def load_csv(self):
       # Open a file dialog to select the CSV file
       file_path, _ = QFileDialog.getOpenFileName(self, "실험 자료 (CSV)를 불러오세요.", "", "CSV Files (*.csv);;All Files (*)")
+      if not file_path:
+          return
 
-      try:
-          # Load the CSV file
-          df = pd.read_csv(file_path, encoding="cp949", header=1)
+      # The followed log would otherwise replace this experiment on its next poll
+      self.stop_following()
 
+      try:
           # Get the selected pressure and temperature sensor numbers
-          self.pressure_sensor_num = int(self.pressure_dropdown.currentText())
-          self.temperature_sensor_num = int(self.temperature_dropdown.currentText())
+          pressure_sensor_num = int(self.pressure_dropdown.currentText())
+          temperature_sensor_num = int(self.temperature_dropdown.currentText())
+          divide_pressure_by = float(self.divide_pressure_by.text())
+          divide_temp_by = float(self.divide_temp_by.text())
+          time_range = time_range_seconds({'time_range': parse_scale(self.time_range.text()), 'time_unit': TIME_UNIT_KEYS[self.time_unit_dropdown.currentText()]})
+          all_channels = LAYOUT_KEYS[self.layout_dropdown.currentText()] != 'single'
+
+          # Parse on the thread pool so the window keeps responding
+          trace = self.new_trace("load", file_path)
+          def load(progress, cancelled):
+              with trace.activate():
+                  channels = None
+                  if all_channels:
+                      # Every channel in one parse; the selected pair is a view of it
+                      channels = load_channels(file_path, divide_pressure_by, divide_temp_by, progress, cancelled, time_range)
+                      experiment = channels.experiment(pressure_sensor_num, temperature_sensor_num)
+                      with span("stats", rows=len(experiment)):
+                          stats = experiment_stats(experiment)
+                  else:
+                      experiment, stats = load_experiment(file_path, pressure_sensor_num, temperature_sensor_num, divide_pressure_by, divide_temp_by, progress, cancelled, time_range)
+                  # Detected and summarised here too, so the panel and the first plot do not wait for them
+                  experiment.events()
+                  load_pyramids(file_path, experiment, pressure_sensor_num, temperature_sensor_num, persist=time_range is None)
+                  return pressure_sensor_num, temperature_sensor_num, (experiment, stats), channels
+
+          self.trace = trace
+          worker = Worker(load)
+          worker.signals.finished.connect(self.csv_loaded)
+          worker.signals.failed.connect(self.csv_failed)
+          self.start_task(worker, f"{os.path.basename(file_path)} 불러오는 중...", cancellable=True)
+
+      except Exception as e:
+          # Show an error message
+          QMessageBox.critical(self, "Error", f"CSV 파일을 불러오는데 실패했어요. 에러: {e}")
+
+    def load_archive(self):
+      # Pick an archive folder (python src.py archive ...) and one experiment in it
+      archive_dir = QFileDialog.getExistingDirectory(self, "Parquet 아카이브 폴더를 선택하세요.")
+      if not archive_dir:
+          return
+
+      try:
+          names = archive_experiments(archive_dir)
+          if not names:
+              QMessageBox.critical(self, "Error", "이 폴더에는 아카이브된 실험이 없어요.")
+              return
+          name, ok = QInputDialog.getItem(self, "아카이브에서 불러오기", "불러올 실험을 선택하세요:", names, 0, False)
+          if not ok:
+              return
 
-          # Get the pressure, temperature, and time data
-          pressure = df.iloc[1:, self.pressure_sensor_num + 1].astype(float)
-          pres = pressure / float(self.divide_pressure_by.text())
+          self.stop_following()
 
-          raw_temp = df.iloc[1:, self.temperature_sensor_num + 3].astype(float)
-          temp = raw_temp / float(self.divide_temp_by.text())
+          pressure_sensor_num = int(self.pressure_dropdown.currentText())
+          temperature_sensor_num = int(self.temperature_dropdown.currentText())
+          divide_pressure_by = float(self.divide_pressure_by.text())
+          divide_temp_by = float(self.divide_temp_by.text())
+          time_range = time_range_seconds({'time_range': parse_scale(self.time_range.text()), 'time_unit': TIME_UNIT_KEYS[self.time_unit_dropdown.currentText()]})
+          all_channels = LAYOUT_KEYS[self.layout_dropdown.currentText()] != 'single'
 
-          # Make time_sec universal
-          self.time_sec = df.iloc[1:, 1].astype(float)
-          self.time_min = self.time_sec / 60 # Convert time from second to minute
+          # Only the selected channels and time window are read from the archive
+          trace = self.new_trace("load", f"{archive_dir} ({name})")
+          def load(progress, cancelled):
+              with trace.activate():
+                  channels = None
+                  if all_channels:
+                      channels = load_archived_channels(archive_dir, name, divide_pressure_by, divide_temp_by, time_range)
+                      experiment = channels.experiment(pressure_sensor_num, temperature_sensor_num)
+                      with span("stats", rows=len(experiment)):
+                          stats = experiment_stats(experiment)
+                  else:
+                      experiment, stats = load_archived_experiment(archive_dir, name, pressure_sensor_num, temperature_sensor_num, divide_pressure_by, divide_temp_by, time_range)
+                  experiment.events()
+                  load_pyramids(archive_dir, experiment, pressure_sensor_num, temperature_sensor_num, persist=False)
+                  return pressure_sensor_num, temperature_sensor_num, (experiment, stats), channels
 
-          # Update the data preview text box
-          self.data_preview.clear()
-          self.data_preview.append("압력 데이터:\n")
-          self.data_preview.append(str(pres.head()) + "\n\n")
-          self.data_preview.append("온도 데이터:\n")
-          self.data_preview.append(str(temp.head()))
+          self.trace = trace
+          worker = Worker(load)
+          worker.signals.finished.connect(self.csv_loaded)
+          worker.signals.failed.connect(self.csv_failed)
+          self.start_task(worker, f"{name} 불러오는 중...")
 
-          pres_mean = pres.mean()
-          pres_std = pres.std()
-          temp_mean = temp.mean()
-          temp_std = temp.std()
+      except Exception as e:
+          QMessageBox.critical(self, "Error", f"아카이브를 불러오는데 실패했어요. 에러: {e}")
+
+    def csv_loaded(self, result):
+      self.finish_task("CSV 파일을 불러왔어요.")
+
+      try:
+          self.pressure_sensor_num, self.temperature_sensor_num, (self.experiment, stats), self.channels = result
+          # Point the data table at the new arrays; nothing is formatted until it is shown
+          with self.trace.activate(), span("preview"):
+              self.table_model.set_experiment(self.experiment)
+
+          # One-pass statistics over every row, scaled by the divisors
+          pres_stats = stats['pressure'].scaled(self.experiment.divide_pressure_by)
+          temp_stats = stats['temperature'].scaled(self.experiment.divide_temp_by)
 
           self.treated_data.clear()
           self.treated_data.append("처리된 데이터 미리보기:\n")
-          self.treated_data.append(f"Pressure mean: {pres_mean:.2f}\n")
-          self.treated_data.append(f"Pressure std: {pres_std:.2f}\n")
-          self.treated_data.append(f"Temperature mean: {temp_mean:.2f}\n")
-          self.treated_data.append(f"Temperature std: {temp_std:.2f}\n")
+          self.treated_data.append(f"Pressure mean: {pres_stats.mean:.2f}\n")
+          self.treated_data.append(f"Pressure std: {pres_stats.std:.2f}\n")
+          self.treated_data.append(f"Pressure min / max: {pres_stats.min:.2f} / {pres_stats.max:.2f}\n")
+          self.treated_data.append(f"Temperature mean: {temp_stats.mean:.2f}\n")
+          self.treated_data.append(f"Temperature std: {temp_stats.std:.2f}\n")
+          self.treated_data.append(f"Temperature min / max: {temp_stats.min:.2f} / {temp_stats.max:.2f}\n")
+          self.treated_data.append(f"Rows: {pres_stats.count}\n")
+          if not self.experiment.complete:
+              self.treated_data.append("파일이 커서 그래프에는 최소/최대 포락선만 사용해요.\n")
+          self.list_events()
+          self.show_trace(self.trace)
 
           # Show a success message
           QMessageBox.information(self, "Success", "CSV 파일을 성공적으로 불러왔어요.")
 
-          self.df = df
-
       except Exception as e:
           # Show an error message
           QMessageBox.critical(self, "Error", f"CSV 파일을 불러오는데 실패했어요. 에러: {e}")
 
+    def csv_failed(self, error):
+        self.show_trace(self.trace, error)
+        if isinstance(error, LoadCancelled):
+            self.finish_task("불러오기를 취소했어요.")
+            return
+        self.finish_task("")
+        QMessageBox.critical(self, "Error", f"CSV 파일을 불러오는데 실패했어요. 에러: {error}")
+
+    def start_task(self, worker, message, cancellable=False):
+        # One background task at a time; the buttons that start tasks wait for it
+        self.task = worker
+        worker.signals.progress.connect(self.show_progress)
+        self.load_button.setEnabled(False)
+        self.follow_button.setEnabled(False)
+        self.plot_button.setEnabled(False)
+        self.overlay_button.setEnabled(False)
+        self.summary_button.setEnabled(False)
+        self.statusBar().showMessage(message)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.show()
+        self.cancel_button.setVisible(cancellable)
+        QThreadPool.globalInstance().start(worker)
+
+    def show_progress(self, done, total):
+        # Bytes can exceed a 32-bit int, so show per mille
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setValue(int(1000 * done / total) if total else 0)
+
+    def cancel_task(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.statusBar().showMessage("취소하는 중...")
+
+    def finish_task(self, message):
+        self.task = None
+        self.load_button.setEnabled(True)
+        self.follow_button.setEnabled(True)
+        self.plot_button.setEnabled(True)
+        self.overlay_button.setEnabled(True)
+        self.summary_button.setEnabled(True)
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.statusBar().showMessage(message, 5000)
+
+    def follow_csv(self):
+      # Open a file dialog to select the CSV file that is still being logged
+      file_path, _ = QFileDialog.getOpenFileName(self, "기록 중인 실험 자료 (CSV)를 불러오세요.", "", "CSV Files (*.csv);;All Files (*)")
+      if not file_path:
+          return
+
+      try:
+          self.stop_following()
+
+          self.pressure_sensor_num = int(self.pressure_dropdown.currentText())
+          self.temperature_sensor_num = int(self.temperature_dropdown.currentText())
+          settings = self.current_settings()
+
+          tail = LogTail(file_path, [TIME_COLUMN, pressure_column(self.pressure_sensor_num), temperature_column(self.temperature_sensor_num)])
+
+          # The first poll reads the whole log so far, so it runs on the thread pool
+          def first_poll(progress, cancelled):
+              tail.poll(progress=progress, cancelled=cancelled)
+              return tail
+
+          worker = Worker(first_poll)
+          worker.signals.finished.connect(lambda tail: self.follow_started(tail, settings))
+          worker.signals.failed.connect(self.follow_failed)
+          self.start_task(worker, f"{os.path.basename(file_path)} 불러오는 중...", cancellable=True)
+
+      except Exception as e:
+          self.stop_following()
+          QMessageBox.critical(self, "Error", f"CSV 파일을 불러오는데 실패했어요. 에러: {e}")
+
+    def follow_started(self, tail, settings):
+      try:
+          self.finish_task("")
+          self.tail = tail
+          self.set_data(*self.tail.arrays())
+
+          rcparams()
+
+          # One non-modal window that is updated in place
+          from matplotlib.figure import Figure
+          from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+
+          canvas = FigureCanvasQTAgg(Figure())
+          self.follow_settings = settings
+          self.live_plot = LivePlot(canvas, settings, self.followed_series)
+          self.live_plot.fig.tight_layout()
+
+          self.follow_dialog = QDialog(self)
+          self.follow_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+          self.follow_dialog.setWindowTitle(f"실시간 모니터링 - {os.path.basename(tail.file_path)}")
+          self.follow_dialog.setLayout(QVBoxLayout())
+          self.follow_dialog.layout().addWidget(canvas)
+          stop_button = QPushButton("모니터링 종료")
+          stop_button.clicked.connect(self.follow_dialog.close)
+          self.follow_dialog.layout().addWidget(stop_button)
+          self.follow_dialog.finished.connect(self.stop_following)
+          self.follow_dialog.show()
+
+          self.follow_timer = QTimer(self)
+          self.follow_timer.timeout.connect(self.poll_followed_csv)
+          self.follow_timer.start(FOLLOW_INTERVAL_MS)
+
+      except Exception as e:
+          self.stop_following()
+          QMessageBox.critical(self, "Error", f"CSV 파일을 불러오는데 실패했어요. 에러: {e}")
+
+    def follow_failed(self, error):
+        if self.task is not None:
+            self.finish_task("불러오기를 취소했어요." if isinstance(error, LoadCancelled) else "")
+        self.stop_following()
+        if not isinstance(error, LoadCancelled):
+            QMessageBox.critical(self, "Error", f"CSV 파일을 읽는데 실패했어요. 에러: {error}")
+
+    def poll_followed_csv(self):
+        tail = self.tail
+        start = tail.size
+        try:
+            file_size = os.path.getsize(tail.file_path)
+        except Exception as e:
+            self.follow_failed(e)
+            return
+
+        # A shorter file is read again from the top
+        unread = file_size if file_size < tail.offset else file_size - tail.offset
+        if unread > FOLLOW_INLINE_BYTES:
+            # Paused until the catch-up is in, so only one poll touches the tail
+            self.follow_timer.stop()
+            self.follow_worker = Worker(lambda progress, cancelled: tail.poll())
+            self.follow_worker.signals.finished.connect(lambda added: self.follow_caught_up(tail, start, added))
+            self.follow_worker.signals.failed.connect(lambda error: self.follow_caught_up(tail, start, error=error))
+            self.statusBar().showMessage("기록 중인 CSV 파일을 따라잡는 중...")
+            QThreadPool.globalInstance().start(self.follow_worker)
+            return
+
+        try:
+            added = tail.poll()
+        except Exception as e:
+            self.follow_failed(e)
+            return
+        self.show_followed_rows(start, added)
+
+    def follow_caught_up(self, tail, start, added=0, error=None):
+        self.follow_worker = None
+        if getattr(self, "follow_timer", None) is None or tail is not self.tail:
+            # Following stopped, or moved to another log, while it caught up
+            return
+        self.statusBar().clearMessage()
+        if error is not None:
+            self.follow_failed(error)
+            return
+        self.show_followed_rows(start, added)
+        self.follow_timer.start(FOLLOW_INTERVAL_MS)
+
+    def followed_series(self, start=0):
+        # Plotted points of the followed rows from start on; from the first
+        # row, the uptake reference is found again
+        if start == 0:
+            self.follow_moles_ref = None
+        data_x, data_y, self.follow_moles_ref = follow_series(*(array[start:] for array in self.tail.arrays()), self.follow_settings, self.follow_moles_ref)
+        return data_x, data_y
+
+    def show_followed_rows(self, start, added):
+        if not added:
+            return
+
+        appended = self.tail.size == start + added
+        self.set_data(*self.tail.arrays(), append=appended)
+        if not appended:
+            # The file was truncated or replaced and read again from the top
+            self.live_plot.redraw(reload=True)
+        else:
+            # Only the new rows are scaled and drawn
+            self.live_plot.append(*self.followed_series(start))
+        self.follow_dialog.setWindowTitle(f"실시간 모니터링 - {os.path.basename(self.tail.file_path)} ({self.tail.size} rows)")
+
+    def stop_following(self):
+        if getattr(self, "follow_timer", None) is not None:
+            self.follow_timer.stop()
+            self.follow_timer = None
+        # Close the live window too; its finished signal comes back here
+        dialog = getattr(self, "follow_dialog", None)
+        self.follow_dialog = None
+        if dialog is not None:
+            dialog.close()
+
     def plot_data(self):
         
         # Warn user if no data is loaded
-        if not hasattr(self, "df"):
+        if getattr(self, "experiment", None) is None:
             QMessageBox.critical(self, "Error", "데이터를 불러오지 못했어요.")
             return
-        
-        x_var = self.x_var_dropdown.currentText()
-        y_var = self.y_var_dropdown.currentText()
-        x_label = self.x_label.text()
-        y_label = self.y_label.text()
-        dpi = int(self.dpi.text())
-        transparent = self.transparent.isChecked()
-        time_unit = self.time_unit_dropdown.currentText() 
-        line_width = int(self.line_width.text())
 
-        fig, ax = plt.subplots()
+        settings = self.current_settings()
+        trace = self.new_trace("plot")
 
-        rcparams()
-
-        data_x, data_y = None, None
-        if x_var == "시간":
-            data_x = self.time_sec if time_unit == "초" else self.time_min if time_unit == "분" else self.time_min / 60 if time_unit == "시간" else None
-        elif x_var == "온도":
-            data_x = self.df.iloc[1:, self.temperature_sensor_num + 3] / float(self.divide_temp_by.text())
-        elif x_var == "압력":
-            data_x = self.df.iloc[1:, self.pressure_sensor_num + 1] / float(self.divide_pressure_by.text())
+        # Multi-channel layouts draw from the channels loaded with the data
+        if settings['layout'] != 'single':
+            if getattr(self, "channels", None) is None:
+                QMessageBox.critical(self, "Error", "모든 채널을 그리려면 그래프 배치를 먼저 고른 뒤 데이터를 다시 불러와주세요.")
+                return
+            spec = PlotSpec(self.channels.version, settings)
+            with trace.activate():
+                self.preview_dialog()
+                self.plot_view.show_channels(self.channels, settings, spec)
+            self.show_trace(trace)
+            self.preview_and_save(settings, spec)
+            return
 
-        if y_var == "압력":
-            data_y = self.df.iloc[1:, self.pressure_sensor_num + 1] / float(self.divide_pressure_by.text())
-        elif y_var == "온도":
-            data_y = self.df.iloc[1:, self.temperature_sensor_num + 3] / float(self.divide_temp_by.text())
+        # Cached derived series; only a changed divisor recomputes anything
+        self.experiment.set_divisors(settings['divide_pressure_by'], settings['divide_temp_by'])
+        self.experiment.set_gas(settings['gas'], settings['gas_volume'])
+        self.table_model.refresh()
+        resample = resample_spec(settings)
+        with trace.activate():
+            data_x, data_y = self.experiment.select(settings['x_var'], settings['y_var'], settings['time_unit'], resample)
 
         if data_x is None or data_y is None:
             QMessageBox.critical(self, "Error", "데이터를 불러오지 못했어요.")
             return
-        
-        if self.line_or_scatter.currentText() == "선":
-            ax.plot(data_x, data_y, color="black", linewidth=line_width)
-        elif self.line_or_scatter.currentText() == "점":
-            ax.scatter(data_x, data_y, color="black", s = line_width * 2)
-
-        ax.set_xlabel(x_label)
-        ax.set_ylabel(y_label)
-
-        # Adjust the x and y scale 
-        x_scale = self.x_scale.text()
-        y_scale = self.y_scale.text()
-
-        if x_scale != "":
-            x_scale = x_scale.split(",")
-            ax.set_xlim(float(x_scale[0]), float(x_scale[1]))
-        if y_scale != "":
-            y_scale = y_scale.split(",")
-            ax.set_ylim(float(y_scale[0]), float(y_scale[1]))
-
-        # Tightly fit the plot
-        fig.tight_layout()
 
-        # Preview the plot to the user
-        canvas = FigureCanvas(fig)
+        # Everything that changes the plotted samples; labels, limits, line width and DPI do not
+        data_key = (self.experiment.version, len(self.experiment), settings['x_var'], settings['y_var'], settings['time_unit'], settings['divide_pressure_by'], settings['divide_temp_by'], settings['decimation'], resample, settings['gas'], settings['gas_volume'])
+
+        with trace.activate():
+            events = self.experiment.events(resample) if settings['events'] else None
+            # Zoom and pan over time read from the min/max pyramid of the plotted (raw) channel
+            pyramid = self.experiment.pyramid(settings['y_var']) if settings['x_var'] == 'time' and settings['decimation'] == "minmax" and resample is None else None
+            dialog = self.preview_dialog()
+            spec = PlotSpec((self.experiment.version, len(self.experiment)), settings)
+            self.plot_view.update(data_x, data_y, settings, data_key, events, pyramid, spec)
+        self.show_trace(trace)
+        self.preview_and_save(settings, spec)
+
+    def preview_and_save(self, settings, spec=None):
+        dialog = self.preview_dialog()
+        fig = self.plot_view.fig
+
+        # Render the export once the preview is up, while the user looks at it
+        QTimer.singleShot(0, lambda: self.start_prerender(settings, spec))
+
+        # Show the plot preview to the user
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+          # Get the file format from the user
+          file_format, _ = QFileDialog.getSaveFileName(self, "그래프를 저장하세요", "", "PNG Files (*.png);;JPG Files (*.jpg);;PDF Files (*.pdf);;SVG Files (*.svg);;All Files (*)")
+
+          if file_format:
+              
+              # Get the file extension(s)
+              file_ext = file_format.split(".")[-1]
+              output_paths = [file_format]
+              if self.multi_export.isChecked():
+                  base = os.path.splitext(file_format)[0]
+                  output_paths = [f"{base}.{ext}" for ext in ("png", "pdf", "svg")]
+
+              # Put every sample back for an exact export (a streamed log only has its envelope);
+              # not needed when every format was already exported for this spec
+              if settings['exact_export'] and settings['decimation'] != "none" and uncached_exports(fig, output_paths, spec, self.render_cache):
+                  self.plot_view.use_full_data()
+
+              # Save on the thread pool from a plain Agg copy taken here, so the
+              # worker never touches (or changes the DPI of) the figure on screen;
+              # several formats are written in parallel processes
+              self.export_formats = [path.split(".")[-1].lower() for path in output_paths]
+              trace = self.new_trace("save", file_format)
+              with trace.activate(), span("snapshot"):
+                  data = pickle.dumps(fig)
+              def save(progress, cancelled):
+                  with trace.activate(), self.export_lock:
+                      export_cached(agg_figure(pickle.loads(data)), output_paths, settings, spec, self.render_cache, workers=len(output_paths))
+                  return ", ".join(path.split(".")[-1] for path in output_paths)
+
+              self.trace = trace
+              worker = Worker(save)
+              worker.signals.finished.connect(self.plot_saved)
+              worker.signals.failed.connect(self.plot_save_failed)
+              self.start_task(worker, f"{os.path.basename(file_format)} 저장하는 중...")
+          else: 
+              # Show an error message to the user
+              QMessageBox.critical(self, "Error", "그래프를 저장하지 못했어요.")
+
+    def start_prerender(self, settings, spec):
+        # Export bytes of the previewed spec in the last saved format(s), from
+        # a copy on the thread pool, so saving it is only a write. Exact
+        # exports draw every sample instead of the preview's, so they are left
+        # to the save, as are overlays (no spec).
+        if self.prerender_worker is not None:
+            self.prerender_worker.cancel()
+            self.prerender_worker = None
+        if spec is None or (settings['exact_export'] and settings['decimation'] != "none"):
+            return
+        fig = self.plot_view.fig
+        formats = ["png", "pdf", "svg"] if self.multi_export.isChecked() else self.export_formats
+        if all(self.render_cache.get(export_key(spec, fig, file_ext)) is not None for file_ext in formats):
+            return
+
+        data = pickle.dumps(fig)
+        def prerender(progress, cancelled):
+            with self.export_lock:
+                return prerender_exports(agg_figure(pickle.loads(data)), formats, settings, spec, self.render_cache, cancelled)
+
+        self.prerender_worker = Worker(prerender)
+        QThreadPool.globalInstance().start(self.prerender_worker)
+
+    def load_overlay(self):
+        # Open a file dialog to select several CSV files
+        files, _ = QFileDialog.getOpenFileNames(self, "겹쳐 그릴 실험 자료 (CSV)들을 불러오세요.", "", "CSV Files (*.csv);;All Files (*)")
+        if not files:
+            return
+
+        try:
+            pressure_sensor_num = int(self.pressure_dropdown.currentText())
+            temperature_sensor_num = int(self.temperature_dropdown.currentText())
+            divide_pressure_by = float(self.divide_pressure_by.text())
+            divide_temp_by = float(self.divide_temp_by.text())
+
+            trace = self.new_trace("overlay", os.path.dirname(files[0]))
+            def load(progress, cancelled):
+                with trace.activate(), span("load", files=len(files)):
+                    return Session().load(files, pressure_sensor_num, temperature_sensor_num, divide_pressure_by, divide_temp_by, progress=progress, cancelled=cancelled)
+
+            self.trace = trace
+            worker = Worker(load)
+            worker.signals.finished.connect(self.overlay_loaded)
+            worker.signals.failed.connect(self.csv_failed)
+            self.start_task(worker, f"CSV 파일 {len(files)}개를 불러오는 중...", cancellable=True)
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"CSV 파일을 불러오는데 실패했어요. 에러: {e}")
+
+    def overlay_loaded(self, session):
+        self.finish_task(f"CSV 파일 {len(session.experiments)}개를 불러왔어요.")
+        self.show_trace(self.trace)
+        self.session = session
+
+        if session.errors:
+            failed = "\n".join(f"{os.path.basename(file_path)}: {error}" for file_path, error in session.errors)
+            QMessageBox.critical(self, "Error", f"일부 CSV 파일을 불러오지 못했어요.\n{failed}")
+        if not session.experiments:
+            return
+
+        try:
+            settings = self.current_settings()
+            self.preview_dialog()
+            self.plot_view.show_overlay(session.experiments, settings)
+            self.preview_and_save(settings)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"그래프를 그리지 못했어요. 에러: {e}")
+
+    def load_summary(self):
+        # Pick a folder of logs; new or changed ones are summarized into the folder's index
+        folder = QFileDialog.getExistingDirectory(self, "요약할 실험 자료 (CSV) 폴더를 선택하세요.")
+        if not folder:
+            return
+
+        try:
+            files = expand_inputs([folder])
+            if not files:
+                QMessageBox.critical(self, "Error", "이 폴더에는 CSV 파일이 없어요.")
+                return
+            index_path = summary_index_path(folder)
+
+            trace = self.new_trace("summary", folder)
+            def index(progress, cancelled):
+                with trace.activate(), span("index", files=len(files)):
+                    return index_logs(files, index_path, progress=progress, cancelled=cancelled)
+
+            self.trace = trace
+            worker = Worker(index)
+            worker.signals.finished.connect(self.summary_indexed)
+            worker.signals.failed.connect(self.csv_failed)
+            self.start_task(worker, f"CSV 파일 {len(files)}개를 요약하는 중...", cancellable=True)
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"실험 요약표를 만들지 못했어요. 에러: {e}")
+
+    def summary_indexed(self, result):
+        summaries, summarized, reused, errors = result
+        self.finish_task(f"{len(summaries)}개 실험을 요약했어요 (새로 계산 {summarized}개, 재사용 {reused}개).")
+        self.show_trace(self.trace)
+
+        if errors:
+            failed = "\n".join(f"{os.path.basename(file_path)}: {error}" for file_path, error in errors)
+            QMessageBox.critical(self, "Error", f"일부 CSV 파일을 요약하지 못했어요.\n{failed}")
+        if not summaries:
+            return
+
+        try:
+            self.summary_dialog(summaries).show()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"실험 요약표를 보여주지 못했어요. 에러: {e}")
+
+    def summary_dialog(self, summaries):
+        # Sortable table of every run, filtered by file name; values use the current divisors and time unit
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"실험 요약표 ({len(summaries)}개)")
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.setLayout(QVBoxLayout())
+
+        model = SummaryTableModel(summaries, float(self.divide_pressure_by.text()), float(self.divide_temp_by.text()), TIME_UNIT_KEYS[self.time_unit_dropdown.currentText()], dialog)
+        proxy = QSortFilterProxyModel(dialog)
+        proxy.setSourceModel(model)
+        proxy.setSortRole(Qt.ItemDataRole.UserRole)
+        proxy.setFilterKeyColumn(0)
+        proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+
+        filter_layout = QHBoxLayout()
+        filter_text = QLineEdit("")
+        filter_text.textChanged.connect(proxy.setFilterFixedString)
+        filter_layout.addWidget(QLabel("파일 이름 필터:"))
+        filter_layout.addWidget(filter_text)
+        dialog.layout().addLayout(filter_layout)
+
+        table = QTableView()
+        table.setModel(proxy)
+        table.setSortingEnabled(True)
+        table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+        table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        table.resizeColumnsToContents()
+        dialog.layout().addWidget(table)
+        dialog.resize(900, 500)
+        return dialog
+
+    def plot_saved(self, file_ext):
+        self.finish_task("그래프를 저장했어요.")
+        self.show_trace(self.trace)
+
+        # Show a success message to the user
+        QMessageBox.information(self, "Success", "그래프를 {} 확장자로 저장했어요.".format(file_ext.upper()))
+
+    def plot_save_failed(self, error):
+        self.finish_task("")
+        self.show_trace(self.trace, error)
+        QMessageBox.critical(self, "Error", f"그래프를 저장하지 못했어요. 에러: {error}")
+
+    def list_events(self):
+        # Detected events in the treated data panel, times in the selected unit
+        events = self.experiment.events()
+        time_unit = TIME_UNIT_KEYS[self.time_unit_dropdown.currentText()]
+        time_values = self.experiment.series('time', time_unit)
+
+        self.treated_data.append(f"\n감지된 이벤트: {len(events)}개\n")
+        for event in events[:MAX_LISTED_EVENTS]:
+            start, end = time_values[event['start']], time_values[event['end']]
+            self.treated_data.append(f"{EVENT_NAMES[event['kind']]}: {start:.2f} - {end:.2f} {time_unit} (변화량 {event['change']:+.2f})")
+        if len(events) > MAX_LISTED_EVENTS:
+            self.treated_data.append(f"... 외 {len(events) - MAX_LISTED_EVENTS}개")
+
+    def new_trace(self, operation, subject=None):
+        # Profile this operation if the switch is on, then turn it off again
+        profile = self.profile_button.isChecked()
+        self.profile_button.setChecked(False)
+        return Trace(operation, subject, profile)
+
+    def show_trace(self, trace, error=None):
+        # Last operation's breakdown in the status bar, every stage in the tooltip
+        if trace is None:
+            return
+        trace.finish(error)
+        self.timing_label.setText(trace.summary())
+        self.timing_label.setToolTip("\n".join(trace.describe(stage) for stage in trace.spans))
+        if trace.profile_path:
+            self.statusBar().showMessage(f"프로파일을 저장했어요: {trace.profile_path}", 10000)
+
+    def start_warm_up(self):
+        # Called once the window is up; nothing waits for the result
+        self.warm_up_worker = Worker(lambda progress, cancelled: warm_up())
+        QThreadPool.globalInstance().start(self.warm_up_worker)
+
+    def preview_dialog(self):
+        # Built once; every plot reuses the same dialog, figure and canvas
+        if getattr(self, "plot_dialog", None) is not None:
+            return self.plot_dialog
+
+        rcparams()
+        with span("canvas"):
+            self.plot_view = PlotView(self.render_cache)
+
+        from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
 
-        # Create a new QDialog object to act as the parent widget for the canvas
         dialog = QDialog(self)
         dialog.setWindowTitle("그래프 미리보기")
         dialog.setLayout(QVBoxLayout())
-        dialog.layout().addWidget(canvas)
+        dialog.layout().addWidget(NavigationToolbar2QT(self.plot_view.canvas, dialog))
+        dialog.layout().addWidget(self.plot_view.canvas)
 
         # Add the Confirm and Cancel buttons to the QDialog
         hlayout = QHBoxLayout()
@@ -489,29 +4188,68 @@ class DWSPapyrusGUI(QMainWindow):
         hlayout.addWidget(cancel_button)
         dialog.layout().addLayout(hlayout)
 
-        # Show the plot preview to the user
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-          # Get the file format from the user
-          file_format, _ = QFileDialog.getSaveFileName(self, "그래프를 저장하세요", "", "PNG Files (*.png);;JPG Files (*.jpg);;PDF Files (*.pdf);;SVG Files (*.svg);;All Files (*)")
-
-          if file_format:
-              
-              # Get the file extension 
-              file_ext = file_format.split(".")[-1]
+        self.plot_dialog = dialog
+        return dialog
 
-              # Save the plot to the file. 
-              fig.savefig(file_format, format=file_ext, dpi=dpi, transparent=transparent, bbox_inches="tight")
+    def set_data(self, time_sec, pressure, temperature, append=False):
+        # Loaded arrays, scaled with the divisors currently in the fields;
+        # append=True when they only add rows to the current experiment,
+        # which then grows in place
+        if append and getattr(self, "experiment", None) is not None:
+            self.experiment.extend(time_sec, pressure, temperature)
+        else:
+            self.experiment = Experiment(time_sec, pressure, temperature, float(self.divide_pressure_by.text()), float(self.divide_temp_by.text()))
+            self.channels = None
+        self.table_model.set_experiment(self.experiment, append)
 
-              # Show a success message to the user
-              QMessageBox.information(self, "Success", "그래프를 {} 확장자로 저장했어요.".format(file_ext.upper()))
-          else: 
-              # Show an error message to the user
-              QMessageBox.critical(self, "Error", "그래프를 저장하지 못했어요.")
+    def current_settings(self):
+        # Collect the widget values in the same form the headless pipeline uses
+        settings = dict(DEFAULT_SETTINGS)
+        settings.update({
+            'pressure_sensor_num': getattr(self, "pressure_sensor_num", int(self.pressure_dropdown.currentText())),
+            'temperature_sensor_num': getattr(self, "temperature_sensor_num", int(self.temperature_dropdown.currentText())),
+            'divide_pressure_by': float(self.divide_pressure_by.text()),
+            'divide_temp_by': float(self.divide_temp_by.text()),
+            'x_var': VARIABLE_KEYS[self.x_var_dropdown.currentText()],
+            'y_var': VARIABLE_KEYS[self.y_var_dropdown.currentText()],
+            'x_label': self.x_label.text(),
+            'y_label': self.y_label.text(),
+            'time_unit': TIME_UNIT_KEYS[self.time_unit_dropdown.currentText()],
+            'x_scale': parse_scale(self.x_scale.text()),
+            'y_scale': parse_scale(self.y_scale.text()),
+            'dpi': int(self.dpi.text()),
+            'transparent': self.transparent.isChecked(),
+            'line_width': int(self.line_width.text()),
+            'plot_style': PLOT_STYLE_KEYS[self.line_or_scatter.currentText()],
+            'decimation': DECIMATION_KEYS[self.decimation_dropdown.currentText()],
+            'exact_export': self.exact_export.isChecked(),
+            'rasterize': self.rasterize.isChecked(),
+            'events': self.show_events.isChecked(),
+            'layout': LAYOUT_KEYS[self.layout_dropdown.currentText()],
+            'gas': self.gas_dropdown.currentText(),
+            'gas_volume': float(self.gas_volume.text()),
+            'resample': RESAMPLE_KEYS[self.resample_dropdown.currentText()],
+            'aggregate': AGGREGATE_KEYS[self.aggregate_dropdown.currentText()],
+        })
+        return settings
 
     def update_labels(self):
         self.x_label.setText(self.variable_labels.get(self.x_var_dropdown.currentText(), ''))
         self.y_label.setText(self.variable_labels.get(self.y_var_dropdown.currentText(), ''))
 
+    def jump_to_time(self):
+        # Binary search on the Time column, then scroll that row to the top
+        if self.table_model.rowCount() == 0:
+            return
+        try:
+            time_sec = float(self.jump_time.text()) * TIME_UNIT_SECONDS[TIME_UNIT_KEYS[self.time_unit_dropdown.currentText()]]
+        except ValueError:
+            QMessageBox.critical(self, "Error", "이동할 시간을 숫자로 입력해주세요.")
+            return
+        index = self.table_model.index(self.table_model.row_at_time(time_sec), 0)
+        self.data_table.scrollTo(index, QTableView.ScrollHint.PositionAtTop)
+        self.data_table.selectRow(index.row())
+
     def update_time_label(self):
         if self.x_var_dropdown.currentText() == "시간":
             self.x_label.setText(self.time_unit_mapping.get(self.time_unit_dropdown.currentText(), ''))
@@ -719,6 +4457,25 @@ QTabWidget::tab-bar {
 """
         
 if __name__ == '__main__':
+    # Needed for the process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+
+    # Headless batch mode: python src.py batch <inputs...> [options]
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        sys.exit(main_batch(sys.argv[2:]))
+
+    # Logs -> Parquet archive: python src.py archive <inputs...> -o <archive>
+    if len(sys.argv) > 1 and sys.argv[1] == "archive":
+        sys.exit(main_archive(sys.argv[2:]))
+
+    # Summary table of many logs: python src.py summary <inputs...> [-o summary.csv]
+    if len(sys.argv) > 1 and sys.argv[1] == "summary":
+        sys.exit(main_summary(sys.argv[2:]))
+
+    # Watch-folder render daemon: python src.py watch <folder> [-o <outputs>] [options]
+    if len(sys.argv) > 1 and sys.argv[1] == "watch":
+        sys.exit(main_watch(sys.argv[2:]))
+
     app = QApplication(sys.argv)
 
     # Stylesheet addition
@@ -727,4 +4484,7 @@ if __name__ == '__main__':
     # Create the main window
     gui = DWSPapyrusGUI()
     gui.show()
+
+    # Load pandas/matplotlib in the background once the window is on screen
+    QTimer.singleShot(0, gui.start_warm_up)
     sys.exit(app.exec())
\ No newline at end of file